@@ -43,7 +43,7 @@ class MazeNode(Node):
         state: tuple[int, int],
         cost: int,
         parent: Node | None = None,
-        action: str | None = None,
+        action: int | None = None,
         color: tuple[int, int, int] = WHITE
     ) -> None:
         super().__init__(value, state, cost, parent, action)
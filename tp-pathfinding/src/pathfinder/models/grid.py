@@ -1,89 +1,166 @@
+from array import array
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
 from src.pathfinder.models.node import Node
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# Actions are small ints, indexing the (row, col) offset they produce
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+DELTAS: tuple[tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Template of neighbors specialized for fixed grid dimensions, taking the
+# wall and cost buffers as arguments
+_NEIGHBORS_SOURCE = """
+def neighbors(walls, cost, pos):
+    row, col = pos
+    idx = row * {width} + col
+    out = []
+    if row > 0 and not walls[idx - {width}]:
+        out.append(({up}, (row - 1, col), cost[idx - {width}]))
+    if row < {last_row} and not walls[idx + {width}]:
+        out.append(({down}, (row + 1, col), cost[idx + {width}]))
+    if col > 0 and not walls[idx - 1]:
+        out.append(({left}, (row, col - 1), cost[idx - 1]))
+    if col < {last_col} and not walls[idx + 1]:
+        out.append(({right}, (row, col + 1), cost[idx + 1]))
+    return out
+"""
+
+
+class GridBuffers(NamedTuple):
+    """Flat row-major buffers of a grid, indexed by row * width + col
+
+    walls and cost are read-only. h and h_initial memoize the Manhattan
+    distances to the end and to the initial cell (-1 if not computed yet),
+    searches may fill them in the same way Grid.h does.
+    """
+
+    walls: memoryview
+    cost: memoryview
+    h: array
+    h_initial: array
+
+
+@lru_cache(maxsize=None)
+def _neighbors_kernel(height: int, width: int) -> Callable:
+    """Generate a neighbors function with the grid dimensions as constants
+
+    Compiled once per (height, width), so grids of the same size share it.
+
+    Args:
+        height (int): Grid height
+        width (int): Grid width
+
+    Returns:
+        Callable: Function of (walls, cost, pos) returning the
+        (action, position, cost) tuples of the reachable neighbors
+    """
+    source = _NEIGHBORS_SOURCE.format(
+        width=width, last_row=height - 1, last_col=width - 1,
+        up=UP, down=DOWN, left=LEFT, right=RIGHT,
+    )
+    namespace: dict = {}
+    exec(compile(source, f"<neighbors {height}x{width}>", "exec"), namespace)
+    return namespace["neighbors"]
+
 
 class Grid:
+    __slots__ = (
+        "grid", "start", "initial", "end", "width", "height",
+        "_er", "_ec", "_walls", "_cost", "_h", "_h_initial", "neighbors",
+    )
+
     def __init__(
         self, grid: list[list[Node]], initial: tuple[int, int], end: tuple[int, int]
     ) -> None:
+        # Original node matrix, kept for legacy access only: the search
+        # methods read the flat _walls and _cost buffers built below
         self.grid: list[list[Node]] = grid
         # Initial cell
         self.start = initial
         self.initial = initial
-        # End cell
+        # End cell, also kept as two ints for the objective test
         self.end = end
+        self._er, self._ec = end
 
         # Calculate grid dimensions
         self.width = max(len(row) for row in grid)
         self.height = len(grid)
 
-    def actions(self, pos: tuple[int, int]) -> list[str]:
+        # Flat row-major wall bitmap and cell costs, indexed by
+        # row * width + col (missing cells in ragged rows are walls)
+        self._walls = bytearray(b"\x01") * (self.width * self.height)
+        self._cost = array("i", [0]) * (self.width * self.height)
+
+        for r, row in enumerate(grid):
+            base = r * self.width
+            for c, cell in enumerate(row):
+                if cell.value != "#":
+                    self._walls[base + c] = 0
+                    self._cost[base + c] = cell.cost
+
+        # Manhattan distances to the end and to the initial cell, filled
+        # lazily on first access (-1 if not computed yet)
+        self._h = array("i", [-1]) * (self.width * self.height)
+        self._h_initial = array("i", [-1]) * (self.width * self.height)
+
+        # neighbors(pos) lists the reachable neighbors of a cell as
+        # (action, resulting cell position, cost of the action) tuples,
+        # fusing actions, result and individual_cost in a single pass.
+        # It is specialized for this grid and bound to its buffers
+        self.neighbors: Callable[
+            [tuple[int, int]], list[tuple[int, tuple[int, int], int]]
+        ] = partial(
+            _neighbors_kernel(self.height, self.width), self._walls, self._cost
+        )
+
+    def actions(self, pos: tuple[int, int]) -> list[int]:
         """Determine the possible actions from a cell
 
         Args:
             pos (tuple[int, int]): Cell position
 
         Returns:
-            list[str]: Possible actions
+            list[int]: Possible actions (UP, DOWN, LEFT or RIGHT)
         """
         row, col = pos
+        h, w, walls = self.height, self.width, self._walls
+        idx = row * w + col
 
-        # Map actions with resulting cell positions
-        action_pos_mapper = {
-            "up": (row - 1, col),
-            "down": (row + 1, col),
-            "left": (row, col - 1),
-            "right": (row, col + 1),
-            # "upleft": (row - 1, col - 1),
-            # "upright": (row - 1, col + 1),
-            # "downleft": (row + 1, col - 1),
-            # "downright": (row + 1, col + 1),
-        }
-
-        # Determine possilbe actions
+        # Determine possible actions, checking bounds and walls for
+        # each direction without building intermediate containers
         possible_actions = []
 
-        for action, (r, c) in action_pos_mapper.items():
-            if not (0 <= r < self.height and 0 <= c < self.width):
-                continue
-
-            if self.grid[r][c].value == "#":
-                continue
-
-            possible_actions.append(action)
+        if row > 0 and not walls[idx - w]:
+            possible_actions.append(UP)
+        if row + 1 < h and not walls[idx + w]:
+            possible_actions.append(DOWN)
+        if col > 0 and not walls[idx - 1]:
+            possible_actions.append(LEFT)
+        if col + 1 < w and not walls[idx + 1]:
+            possible_actions.append(RIGHT)
 
         return possible_actions
 
-    def result(self, pos: tuple[int, int], action: str) -> tuple[int, int]:
+    def result(self, pos: tuple[int, int], action: int) -> tuple[int, int]:
         """Get the resulting cell position after performing an action
 
         Args:
             pos (tuple[int, int]): Cell position
-            action (str): Action to perform
+            action (int): Action to perform
 
         Returns:
             tuple[int, int]: Resulting cell position
         """
-        row, col = pos
+        if action not in (UP, DOWN, LEFT, RIGHT):
+            raise ValueError(f"Invalid action: {action}")
+
+        dr, dc = DELTAS[action]
 
-        match action:
-            case "up":
-                return (row - 1, col)
-            case "down":
-                return (row + 1, col)
-            case "left":
-                return (row, col - 1)
-            case "right":
-                return (row, col + 1)
-            # case "upleft":
-            #     return (row - 1, col - 1)
-            # case "upright":
-            #     return (row - 1, col + 1)
-            # case "downleft":
-            #     return (row + 1, col - 1)
-            # case "downright":
-            #     return (row + 1, col + 1)
-            case _:
-                raise ValueError(f"Invalid action: {action}")
+        return (pos[0] + dr, pos[1] + dc)
 
     def objective_test(self, pos: tuple[int, int]) -> bool:
         """Test if the cell is the goal
@@ -94,20 +171,74 @@ class Grid:
         Returns:
             bool: True if the cell is the goal, False otherwise
         """
-        return pos == self.end
+        return pos[0] == self._er and pos[1] == self._ec
 
-    def individual_cost(self, pos: tuple[int, int], action: str) -> int:
+    def individual_cost(self, pos: tuple[int, int], action: int) -> int:
         """Get the cost of performing an action from a cell
 
         Args:
             pos (tuple[int, int]): Cell position
-            action (str): Action to perform
+            action (int): Action to perform
 
         Returns:
             int: Cost of performing the action
         """
-        new_pos = self.result(pos, action)
-        return self.grid[new_pos[0]][new_pos[1]].cost
+        if action not in (UP, DOWN, LEFT, RIGHT):
+            raise ValueError(f"Invalid action: {action}")
+
+        dr, dc = DELTAS[action]
+
+        row, col = pos
+        return self._cost[(row + dr) * self.width + col + dc]
+
+    def h(self, row: int, col: int) -> int:
+        """Get the Manhattan distance from a cell to the end
+
+        Args:
+            row (int): Cell row
+            col (int): Cell column
+
+        Returns:
+            int: Distance to the end cell
+        """
+        table = self._h
+        idx = row * self.width + col
+        value = table[idx]
+        if value < 0:
+            value = table[idx] = abs(row - self._er) + abs(col - self._ec)
+        return value
+
+    def buffers(self) -> GridBuffers:
+        """Expose the flat buffers read by the searches' inner loops
+
+        Returns:
+            GridBuffers: Walls and cell costs, as read-only views, and the
+            memoized distances to the end and to the initial cell
+        """
+        return GridBuffers(
+            memoryview(self._walls).toreadonly(),
+            memoryview(self._cost).toreadonly(),
+            self._h,
+            self._h_initial,
+        )
+
+    def to_arrays(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """Export walls and cell costs as NumPy arrays
+
+        The arrays are views over the grid buffers, no data is copied.
+        Requires NumPy, which is only needed by the compiled search kernels.
+
+        Returns:
+            np.ndarray: 1 for walls, 0 otherwise (uint8[height, width])
+            np.ndarray: Cost of entering every cell (int32[height, width])
+        """
+        import numpy as np
+
+        shape = (self.height, self.width)
+        walls = np.frombuffer(self._walls, dtype=np.uint8).reshape(shape)
+        cost = np.frombuffer(self._cost, dtype=np.intc).reshape(shape)
+
+        return walls, cost
 
     def __repr__(self) -> str:
         return f"Grid([[...], ...], {self.initial}, {self.end})"
@@ -7,7 +7,7 @@ class Node:
         state: tuple[int, int],
         cost: int,
         parent: Node | None = None,
-        action: str | None = None
+        action: int | None = None
     ) -> None:
         self.value = value
         self.state = state
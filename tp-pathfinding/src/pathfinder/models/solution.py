@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Collection
 from .node import Node
 
 class Solution:
@@ -7,7 +7,7 @@ class Solution:
     def __init__(
         self,
         node: Node,
-        reached: dict[tuple[int, int], Any],
+        reached: Collection[tuple[int, int]],
         time: float = 0
     ) -> None:
 
@@ -37,7 +37,7 @@ class NoSolution(Solution):
 
     def __init__(
         self,
-        reached: dict[tuple[int, int], Any],
+        reached: Collection[tuple[int, int]],
         time: float = 0
     ) -> None:
         self.path = []
@@ -0,0 +1,109 @@
+# distutils: language = c++
+# cython: language_level=3, boundscheck=False, wraparound=False
+from array import array
+
+from libcpp.pair cimport pair
+from libcpp.queue cimport priority_queue
+
+
+def astar_core(
+    const unsigned char[:] walls,
+    const int[:] cost,
+    int height,
+    int width,
+    int sr,
+    int sc,
+    int er,
+    int ec
+):
+    """Run A* Search over flat grid buffers
+
+    Unidirectional A* like the Numba kernel, over the flat row-major
+    buffers of Grid instead of 2D NumPy arrays, so NumPy is not needed.
+    The frontier is a C++ priority queue of (-f, -cell index) pairs, so the
+    smallest f comes first and ties go to the lowest index. Stale entries
+    are skipped when popped.
+
+    The Numba heap breaks ties on f only, so both kernels find a path of
+    the same optimal cost, but not necessarily the same path or the same
+    reached cells.
+
+    Args:
+        walls (bytearray): 1 for walls, 0 otherwise (height * width)
+        cost (array): Cost of entering every cell (height * width)
+        height (int): Grid height
+        width (int): Grid width
+        sr (int): Start row
+        sc (int): Start column
+        er (int): End row
+        ec (int): End column
+
+    Returns:
+        array: Parent index of every cell, -1 if unreached
+        array: Best known cost of every cell, -1 if unreached
+        array: Cell indexes in the order they were reached
+        int: Number of reached cells
+    """
+    cdef int n = height * width
+    cdef int start = sr * width + sc
+    cdef int goal = er * width + ec
+
+    parents_buf = array("i", [-1]) * n
+    g_buf = array("i", [-1]) * n
+    order_buf = array("i", [0]) * n
+    cdef int[:] parents = parents_buf
+    cdef int[:] g = g_buf
+    cdef int[:] order = order_buf
+
+    cdef priority_queue[pair[int, int]] frontier
+    cdef pair[int, int] top
+    cdef int f, cur, r, c, k, nr, nc, nxt, ng
+    cdef int n_reached = 1
+    cdef int dr[4]
+    cdef int dc[4]
+    dr[:] = [-1, 1, 0, 0]
+    dc[:] = [0, 0, -1, 1]
+
+    g[start] = 0
+    order[0] = start
+    frontier.push(pair[int, int](-(abs(sr - er) + abs(sc - ec)), -start))
+
+    while not frontier.empty():
+        top = frontier.top()
+        frontier.pop()
+        f = -top.first
+        cur = -top.second
+
+        r = cur // width
+        c = cur - r * width
+
+        # Skip entries superseded by a cheaper path
+        if f - abs(r - er) - abs(c - ec) > g[cur]:
+            continue
+
+        if cur == goal:
+            break
+
+        for k in range(4):
+            nr = r + dr[k]
+            nc = c + dc[k]
+            if nr < 0 or nr >= height or nc < 0 or nc >= width:
+                continue
+
+            nxt = nr * width + nc
+            if walls[nxt]:
+                continue
+
+            ng = g[cur] + cost[nxt]
+            if g[nxt] != -1 and ng >= g[nxt]:
+                continue
+
+            if g[nxt] == -1:
+                order[n_reached] = nxt
+                n_reached += 1
+            g[nxt] = ng
+            parents[nxt] = cur
+
+            frontier.push(pair[int, int](-(ng + abs(nr - er) + abs(nc - ec)), -nxt))
+
+    return parents_buf, g_buf, order_buf, n_reached
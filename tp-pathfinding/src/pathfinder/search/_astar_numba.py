@@ -0,0 +1,133 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def astar_core(
+    cost: np.ndarray,
+    walls: np.ndarray,
+    sr: int,
+    sc: int,
+    er: int,
+    ec: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Run A* Search over flat grid arrays
+
+    Cells are identified by their row-major index ``row * width + col``.
+    The frontier is a binary heap stored as two parallel arrays (f-score
+    and cell index), with stale entries skipped when popped.
+
+    Args:
+        cost (np.ndarray): Cost of entering every cell (int32[H, W])
+        walls (np.ndarray): 1 for walls, 0 otherwise (uint8[H, W])
+        sr (int): Start row
+        sc (int): Start column
+        er (int): End row
+        ec (int): End column
+
+    Returns:
+        np.ndarray: Parent index of every cell, -1 if unreached (int32[H*W])
+        np.ndarray: Best known cost of every cell, -1 if unreached (int32[H*W])
+        np.ndarray: Cell indexes in the order they were reached (int32[H*W])
+        int: Number of reached cells
+    """
+    h, w = walls.shape
+    n = h * w
+
+    parents = np.full(n, -1, np.int32)
+    g = np.full(n, -1, np.int32)
+    order = np.empty(n, np.int32)
+
+    heap_f = np.empty(4 * n + 1, np.int32)
+    heap_i = np.empty(4 * n + 1, np.int32)
+
+    start = sr * w + sc
+    goal = er * w + ec
+
+    g[start] = 0
+    order[0] = start
+    n_reached = 1
+
+    heap_f[0] = abs(sr - er) + abs(sc - ec)
+    heap_i[0] = start
+    size = 1
+
+    dr = (-1, 1, 0, 0)
+    dc = (0, 0, -1, 1)
+
+    while size > 0:
+        # Pop the root and sift the last entry down
+        f = heap_f[0]
+        cur = heap_i[0]
+        size -= 1
+        if size > 0:
+            last_f = heap_f[size]
+            last_i = heap_i[size]
+            pos = 0
+            while True:
+                child = 2 * pos + 1
+                if child >= size:
+                    break
+                if child + 1 < size and heap_f[child + 1] < heap_f[child]:
+                    child += 1
+                if heap_f[child] >= last_f:
+                    break
+                heap_f[pos] = heap_f[child]
+                heap_i[pos] = heap_i[child]
+                pos = child
+            heap_f[pos] = last_f
+            heap_i[pos] = last_i
+
+        r = cur // w
+        c = cur - r * w
+
+        # Skip entries superseded by a cheaper path
+        if f - abs(r - er) - abs(c - ec) > g[cur]:
+            continue
+
+        if cur == goal:
+            break
+
+        gc = g[cur]
+        for k in range(4):
+            nr = r + dr[k]
+            nc = c + dc[k]
+            if nr < 0 or nr >= h or nc < 0 or nc >= w:
+                continue
+            if walls[nr, nc]:
+                continue
+
+            nxt = nr * w + nc
+            ng = gc + cost[nr, nc]
+            if g[nxt] != -1 and ng >= g[nxt]:
+                continue
+
+            if g[nxt] == -1:
+                order[n_reached] = nxt
+                n_reached += 1
+            g[nxt] = ng
+            parents[nxt] = cur
+
+            # Grow the heap if needed, then push and sift up
+            if size == heap_f.shape[0]:
+                grown_f = np.empty(2 * size, np.int32)
+                grown_i = np.empty(2 * size, np.int32)
+                grown_f[:size] = heap_f
+                grown_i[:size] = heap_i
+                heap_f = grown_f
+                heap_i = grown_i
+
+            nf = ng + abs(nr - er) + abs(nc - ec)
+            pos = size
+            size += 1
+            while pos > 0:
+                parent = (pos - 1) // 2
+                if heap_f[parent] <= nf:
+                    break
+                heap_f[pos] = heap_f[parent]
+                heap_i[pos] = heap_i[parent]
+                pos = parent
+            heap_f[pos] = nf
+            heap_i[pos] = nxt
+
+    return parents, g, order, n_reached
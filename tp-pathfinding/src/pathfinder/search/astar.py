@@ -1,29 +1,229 @@
-from ..models.grid import Grid
-from ..models.frontier import PriorityQueueFrontier
+from array import array
+from heapq import heappop, heappush
+from typing import Any, Callable, Optional
+
+from ..models.grid import DELTAS, Grid
 from ..models.solution import NoSolution, Solution
 from ..models.node import Node
 
+# Compiled unidirectional kernels, None when their dependency is missing
+astar_core: Optional[Callable[..., Any]]
+astar_core_c: Optional[Callable[..., Any]]
+
+try:
+    from ._astar_numba import astar_core
+except ImportError:
+    # Numba is optional, fall back to the Cython kernel if it was built
+    astar_core = None
+
+try:
+    from ._astar_c import astar_core as astar_core_c  # type: ignore[import-not-found, no-redef]
+except ImportError:
+    # Neither is required, the pure Python search is used otherwise
+    astar_core_c = None
+
+# Map (row, col) offsets back to actions
+_ACTIONS = {delta: action for action, delta in enumerate(DELTAS)}
+
 
 class AStarSearch:
+    # Opt-in: when True and Numba is available or the Cython extension was
+    # built, search runs the compiled kernel instead. The kernels run a
+    # unidirectional A*, so paths match in cost but the reached cells differ
+    use_compiled = False
+
     @staticmethod
     def search(grid: Grid) -> Solution:
         """Find path between two points in a grid using A* Search
 
+        Runs a bidirectional A* from both the initial and the end cell,
+        stopping once the frontiers meet on an optimal path. If
+        AStarSearch.use_compiled is set and a compiled kernel is available,
+        runs that unidirectional A* instead.
+
         Args:
             grid (Grid): Grid of points
 
         Returns:
             Solution: Solution found
         """
-        # Initialize root node
-        root = Node("", state=grid.initial, cost=0, parent=None, action=None)
+        if AStarSearch.use_compiled and (
+            astar_core is not None or astar_core_c is not None
+        ):
+            return AStarSearch._search_compiled(grid)
+
+        (start_row, start_col), (end_row, end_col) = grid.initial, grid.end
+        w = grid.width
+        buffers = grid.buffers()
+        neighbors, cost_of = grid.neighbors, buffers.cost
+        n = grid.width * grid.height
+
+        # The forward search goes from the initial cell to the end, the
+        # backward one from the end to the initial cell. For each direction
+        # keep the best known cost per cell (-1 if unreached) and the cell it
+        # was reached from (-1 for the root), plus the reached cells in
+        # discovery order shared by both
+        g_f = array("i", [-1]) * n
+        g_b = array("i", [-1]) * n
+        parents_f = array("i", [-1]) * n
+        parents_b = array("i", [-1]) * n
+
+        start_idx = start_row * w + start_col
+        end_idx = end_row * w + end_col
+        g_f[start_idx] = 0
+        g_b[end_idx] = 0
+        reached = [grid.initial]
+        if end_idx != start_idx:
+            reached.append(grid.end)
+
+        # Initialize both frontiers with their roots, prioritized by the
+        # Manhattan distance to the opposite end (memoized per cell by grid).
+        # Entries are (f, cell index, g): the index breaks ties by position
+        # and the g lets stale entries be skipped without an index map
+        distance = grid.h(start_row, start_col)
+        frontier_f = [(distance, start_idx, 0)]
+        frontier_b = [(distance, end_idx, 0)]
+
+        # Cost of the best path found so far and the cell where it meets
+        best_cost = float("inf")
+        meeting = -1
+        if start_idx == end_idx:
+            best_cost, meeting = 0, start_idx
+
+        while frontier_f and frontier_b:
+
+            # Stop once no unexpanded node can lead to a cheaper path
+            if max(frontier_f[0][0], frontier_b[0][0]) >= best_cost:
+                break
+
+            # Expand the smaller frontier
+            forward = len(frontier_f) <= len(frontier_b)
+            if forward:
+                frontier, g, g_other, parents = frontier_f, g_f, g_b, parents_f
+                h_table, target_row, target_col = buffers.h, end_row, end_col
+            else:
+                frontier, g, g_other, parents = frontier_b, g_b, g_f, parents_b
+                h_table, target_row, target_col = buffers.h_initial, start_row, start_col
+
+            _, idx, node_cost = heappop(frontier)
+
+            # Skip entries superseded by a cheaper path
+            if node_cost > g[idx]:
+                continue
+
+            # Moving backwards from a cell costs what entering it costs
+            exit_cost = 0 if forward else cost_of[idx]
+
+            for _, (row, col), step_cost in neighbors(divmod(idx, w)):
+                cost = node_cost + (step_cost if forward else exit_cost)
+                nidx = row * w + col
+
+                # Only keep the successor if it improves the best known cost
+                if g[nidx] == -1:
+                    if g_other[nidx] == -1:
+                        reached.append((row, col))
+                elif cost >= g[nidx]:
+                    continue
+
+                g[nidx] = cost
+                parents[nidx] = idx
+
+                # Check whether both searches met at this cell, as soon as
+                # it is reached: any cost found by the other search so far
+                # closes a path through it
+                if g_other[nidx] != -1 and cost + g_other[nidx] < best_cost:
+                    best_cost = cost + g_other[nidx]
+                    meeting = nidx
+
+                # Same lazy lookup as grid.h, inlined
+                h = h_table[nidx]
+                if h < 0:
+                    h = h_table[nidx] = abs(row - target_row) + abs(col - target_col)
+
+                # Successors that cannot beat the best path are not expanded
+                if cost + h < best_cost:
+                    heappush(frontier, (cost + h, nidx, cost))
+
+        if meeting == -1:
+            return NoSolution(reached)
+
+        # Splice the forward path, walked back from the meeting cell, with
+        # the backward path, which already runs from there to the end
+        cells = []
+        idx = meeting
+        while idx != -1:
+            cells.append(idx)
+            idx = parents_f[idx]
+        cells.reverse()
+
+        idx = parents_b[meeting]
+        while idx != -1:
+            cells.append(idx)
+            idx = parents_b[idx]
+
+        return Solution(AStarSearch._build_path(grid, cells), reached)
+
+    @staticmethod
+    def _build_path(grid: Grid, cells: list[int]) -> Node:
+        """Materialize the nodes along a path
+
+        Args:
+            grid (Grid): Grid of points
+            cells (list[int]): Cell indexes from the initial cell to the end
+
+        Returns:
+            Node: Node of the last cell, linked back to the initial cell
+        """
+        w, cost = grid.width, grid.buffers().cost
+
+        node = Node("", divmod(cells[0], w), cost=0, parent=None, action=None)
+        for idx in cells[1:]:
+            state = divmod(idx, w)
+            action = _ACTIONS[(state[0] - node.state[0], state[1] - node.state[1])]
+            node = Node("", state, cost=node.cost + cost[idx], parent=node, action=action)
+
+        return node
+
+    @staticmethod
+    def _search_compiled(grid: Grid) -> Solution:
+        """Run a compiled unidirectional kernel and build the Solution
+
+        Prefers the Numba kernel over the Cython one.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            Solution: Solution found
+        """
+        (sr, sc), (er, ec) = grid.initial, grid.end
+        if astar_core is not None:
+            walls, cost = grid.to_arrays()
+            parents, g, order, n_reached = astar_core(cost, walls, sr, sc, er, ec)
+        else:
+            # search only calls this when one of the kernels is available
+            assert astar_core_c is not None
+            buffers = grid.buffers()
+            parents, g, order, n_reached = astar_core_c(
+                buffers.walls, buffers.cost, grid.height, grid.width, sr, sc, er, ec
+            )
+
+        w = grid.width
+
+        # Reached cells in the order they were found
+        reached = [divmod(idx, w) for idx in order[:n_reached].tolist()]
+
+        goal = er * w + ec
+        if g[goal] == -1:
+            return NoSolution(reached)
 
-        # Initialize reached with the initial state
-        reached = {}
-        reached[root.state] = root.cost
+        # Walk the parents back from the goal to the start
+        cells = []
+        idx = goal
+        while idx != -1:
+            cells.append(idx)
+            idx = int(parents[idx])
+        cells.reverse()
 
-        # Initialize frontier with the root node
-        # TODO Complete the rest!!
-        # ...
+        return Solution(AStarSearch._build_path(grid, cells), reached)
 
-        return NoSolution(reached)
@@ -1,5 +1,4 @@
-from ..models.grid import Grid
-from ..models.frontier import QueueFrontier
+from ..models.grid import Grid, RIGHT
 from ..models.solution import NoSolution, Solution
 from ..models.node import Node
 
@@ -15,49 +14,35 @@ class GoRight:
         Returns:
             Solution: Solution found
         """
-        # Initialize root node
-        root = Node("", state=grid.initial, cost=0, parent=None, action=None)
-
-        # Initialize reached with the initial state
-        reached = {}
-        reached[root.state] = True
+        # Bind the goal and the grid buffers once, outside the loop
+        (row, start_col), end_xy = grid.initial, grid.end
+        w = grid.width
+        buffers = grid.buffers()
+        walls, cost = buffers.walls, buffers.cost
+        base = row * w
+
+        # Walk right along the row while the next cell is free,
+        # stopping as soon as the goal is reached
+        col = start_col
+        while (row, col) != end_xy and col + 1 < w and not walls[base + col + 1]:
+            col += 1
+
+        # Every cell on the walk was reached
+        reached = [(row, c) for c in range(start_col, col + 1)]
 
         # Apply objective test
-        if grid.objective_test(root.state):
-            return Solution(root, reached)
-
-        # Current node, starting from the root
-        node = root
-
-        while True:
-
-            # Check if going right is possible
-            if "right" not in grid.actions(node.state):
-                return NoSolution(reached)
+        if (row, col) != end_xy:
+            return NoSolution(reached)
 
-            # Get the successor
-            successor = grid.result(node.state, "right")
-
-            # Check if the successor is reached
-            if successor in reached:
-                continue
-
-            # Initialize the son node
-            son = Node(
+        # Build the nodes along the path only once the goal is found
+        node = Node("", state=grid.initial, cost=0, parent=None, action=None)
+        for c in range(start_col + 1, col + 1):
+            node = Node(
                 "",
-                successor,
-                cost=node.cost + grid.individual_cost(node.state, "right"),
+                (row, c),
+                cost=node.cost + cost[base + c],
                 parent=node,
-                action="right",
+                action=RIGHT,
             )
 
-            # Mark the successor as reached
-            reached[successor] = True
-
-            # Apply objective test
-            if grid.objective_test(successor):
-                return Solution(son, reached)
-            
-            # Continue with the son
-            node = son
-
+        return Solution(node, reached)
@@ -1,17 +1,29 @@
 """
 Módulo de estrategias para el juego del Tateti
 
-Este módulo contiene las estrategias para elegir la acción a realizar.
-Los alumnos deben implementar la estrategia minimax.
+Este módulo contiene las estrategias para elegir la acción a realizar:
 
-Por defecto, se incluye una estrategia aleatoria como ejemplo base.
+* estrategia_aleatoria: elige una acción al azar, como ejemplo base.
+* estrategia_minimax: elige la jugada óptima. La consulta en JUGADAS, la
+  tabla precalculada de minimax.json, y si no figura la calcula con
+  elegir_jugada.
+
+Los valores minimax salen de negamax, una búsqueda con poda alfa-beta y
+tabla de transposiciones, y se guardan en RESULTADOS, que al importar el
+módulo ya tiene todas las posiciones alcanzables de una partida.
 """
 
+import json
+import os
 import random
-from typing import List, Tuple
-from tateti import Tateti, JUGADOR_MAX, JUGADOR_MIN
+from array import array
+from typing import Dict, Tuple
+from tateti import (
+    Tateti, Estado, HAY_LINEA, JUGADOR_MAX, TABLERO_LLENO,
+    accion_original, canonico, codificar
+)
 
-def estrategia_aleatoria(tateti: Tateti, estado: List[List[str]]) -> Tuple[int, int]:
+def estrategia_aleatoria(tateti: Tateti, estado: Estado) -> Tuple[int, int]:
     """
     Estrategia aleatoria: elige una acción al azar entre las disponibles.
   
@@ -31,39 +43,176 @@ def estrategia_aleatoria(tateti: Tateti, estado: List[List[str]]) -> Tuple[int,
     
     return random.choice(acciones_disponibles)
         
-def MINIMAX_MIN(tateti: Tateti, estado: List[List[str]]):
-    if tateti.test_terminal(estado):
-        return tateti.utilidad(estado, JUGADOR_MAX)
-    valor = float("inf")
-    for accion in tateti.acciones(estado):
-        sucesor = tateti.resultado(estado, accion)
-        valor = min(valor, MINIMAX_MAX(tateti, sucesor))
-    return valor
+# La búsqueda usa la formulación negamax: el valor de un estado es el del
+# jugador que mueve (positivo si gana, 0 si empata, negativo si pierde), y
+# el de cada sucesor se niega. Una partida ganada vale 1 más la cantidad de
+# casillas que quedaron libres, así que entre dos victorias se prefiere la
+# más rápida y entre dos derrotas la más lenta. Los valores ya calculados se
+# guardan en una tabla de transposiciones indexada por la forma canónica del
+# estado entre las 8 simetrías del tablero, que tienen el mismo valor.
+
+
+# Orden en que se prueban las casillas: centro, esquinas y bordes, de más
+# a menos líneas ganadoras, para que la poda llegue antes
+ORDEN_CASILLAS = tuple(1 << i for i in (4, 0, 2, 6, 8, 1, 3, 5, 7))
+
+# Tipo de valor guardado en la tabla de transposiciones: exacto, o una cota
+# inferior (hubo poda beta) o superior (ningún sucesor superó alfa)
+EXACTO, COTA_INFERIOR, COTA_SUPERIOR = 0, 1, 2
+
+# Cota del valor absoluto de cualquier estado, para la ventana inicial
+INFINITO = 10
+
+# Código del estado canónico (fichas del que mueve | fichas del rival << 9)
+# -> (valor, tipo)
+TRANSPOSICIONES: Dict[int, Tuple[int, int]] = {}
+
+
+def negamax(propias: int, rivales: int, alfa: int, beta: int) -> int:
+    """
+    Valor negamax de un estado, con poda alfa-beta.
+
+    Args:
+        propias: Máscara con las casillas del jugador que mueve
+        rivales: Máscara con las casillas del rival
+        alfa: Mejor valor asegurado para el jugador que mueve
+        beta: Mejor valor asegurado para el rival, negado
+
+    Returns:
+        int: Positivo si el jugador que mueve gana, 0 si empata, negativo si
+        pierde; en valor absoluto, 1 más las casillas libres al terminar
+    """
+    libres = ~(propias | rivales) & TABLERO_LLENO
+
+    # El rival acaba de mover: solo él puede haber completado una línea
+    if HAY_LINEA[rivales]:
+        return -1 - libres.bit_count()
+    if not libres:
+        return 0
 
-def MINIMAX_MAX(tateti: Tateti, estado: List[List[str]]):
-    if tateti.test_terminal(estado):
-        return tateti.utilidad(estado, JUGADOR_MAX)
-    valor = float("-inf")
-    for accion in tateti.acciones(estado):
-            sucesor = tateti.resultado(estado, accion)
-            valor = max(valor, MINIMAX_MIN(tateti, sucesor))
+    # Los 8 simétricos del estado comparten la entrada del canónico
+    clave = codificar(canonico((propias, rivales))[0])
+    entrada = TRANSPOSICIONES.get(clave)
+    if entrada is not None:
+        valor, tipo = entrada
+        if tipo == EXACTO:
+            return valor
+        if tipo == COTA_INFERIOR:
+            alfa = max(alfa, valor)
+        else:
+            beta = min(beta, valor)
+        if alfa >= beta:
+            return valor
+
+    alfa_inicial = alfa
+    mejor = -INFINITO
+    for bit in ORDEN_CASILLAS:
+        if libres & bit:
+            mejor = max(mejor, -negamax(rivales, propias | bit, -beta, -alfa))
+            alfa = max(alfa, mejor)
+            if alfa >= beta:
+                break
+
+    # Solo es exacto si el valor quedó dentro de la ventana original
+    if mejor <= alfa_inicial:
+        tipo = COTA_SUPERIOR
+    elif mejor >= beta:
+        tipo = COTA_INFERIOR
+    else:
+        tipo = EXACTO
+    TRANSPOSICIONES[clave] = (mejor, tipo)
+    return mejor
+
+
+# Cada estado se codifica en base 3 (casilla i: 0 vacía, 1 X, 2 O, por 3**i)
+# para indexar la tabla con el valor minimax de todas las posiciones.
+# TERNARIO lleva una máscara de 9 bits a la suma de 3**i de sus casillas.
+TERNARIO = tuple(
+    sum(3 ** i for i in range(9) if mascara >> i & 1) for mascara in range(512)
+)
+
+# Valor negamax de cada estado desde el punto de vista de MAX (positivo si
+# gana MAX, negativo si gana MIN), SIN_CALCULAR si no se calculó. Los
+# valores entran en un byte con signo: la tabla ocupa 3**9 bytes
+SIN_CALCULAR = -128
+RESULTADOS = array("b", [SIN_CALCULAR]) * 3 ** 9
+
+
+def _valor(x: int, o: int) -> int:
+    """
+    Valor minimax de un estado, consultando (y completando) la tabla.
+
+    Args:
+        x: Máscara con las casillas de MAX
+        o: Máscara con las casillas de MIN
+
+    Returns:
+        int: Valor del estado para MAX
+    """
+    codigo = TERNARIO[x] + 2 * TERNARIO[o]
+    valor = RESULTADOS[codigo]
+    if valor == SIN_CALCULAR:
+        # Mismo criterio de turno que Tateti.jugador; el valor negamax del
+        # que mueve se pasa al punto de vista de MAX
+        if x.bit_count() > o.bit_count():
+            valor = -negamax(o, x, -INFINITO, INFINITO)
+        else:
+            valor = negamax(x, o, -INFINITO, INFINITO)
+        RESULTADOS[codigo] = valor
     return valor
 
 
-def estrategia_minimax(tateti: Tateti, estado: List[List[str]]) -> Tuple[int, int]: 
-    print("llama est_minima")
-    print("acciones disponibles: ", tateti.acciones(estado))
-    if tateti.jugador(estado) == JUGADOR_MAX:
-        print("if tateti jugafodr")
-        sucs = {accion: MINIMAX_MIN(tateti, tateti.resultado(estado, accion)) for accion in tateti.acciones(estado)}
-        return max(sucs, key=sucs.get)
-    if tateti.jugador(estado) == JUGADOR_MIN:
-        sucs = {accion: MINIMAX_MAX(tateti, tateti.resultado(estado, accion)) for accion in tateti.acciones(estado)}
+def _llenar_resultados(x: int, o: int) -> None:
+    """Completa la tabla para todos los estados alcanzables desde (x, o)."""
+    if RESULTADOS[TERNARIO[x] + 2 * TERNARIO[o]] != SIN_CALCULAR:
+        return
+    _valor(x, o)
+    if HAY_LINEA[x] or HAY_LINEA[o]:
+        return
+    libres = ~(x | o) & TABLERO_LLENO
+    mueve_max = x.bit_count() <= o.bit_count()
+    while libres:
+        bit = libres & -libres
+        libres ^= bit
+        if mueve_max:
+            _llenar_resultados(x | bit, o)
+        else:
+            _llenar_resultados(x, o | bit)
+
+
+# Las 5478 posiciones de una partida se evalúan una sola vez, al importar
+_llenar_resultados(0, 0)
 
-        return min(sucs, key=sucs.get) 
 
+# Jugada óptima precalculada para cada estado canónico no terminal de una
+# partida, generada con generar_tabla.py. La clave es codificar(estado).
+ARCHIVO_JUGADAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "minimax.json")
+
+
+def _cargar_jugadas() -> Dict[int, Tuple[int, int]]:
+    """
+    Carga la tabla de jugadas precalculadas, si existe.
+
+    Returns:
+        Dict[int, Tuple[int, int]]: Acción elegida para cada clave de estado
+    """
+    try:
+        with open(ARCHIVO_JUGADAS, encoding="utf-8") as archivo:
+            tabla = json.load(archivo)
+    except FileNotFoundError:
+        return {}
+    return {int(clave): (fila, columna) for clave, (fila, columna) in tabla.items()}
+
+
+JUGADAS = _cargar_jugadas()
+
+
+def estrategia_minimax(tateti: Tateti, estado: Estado) -> Tuple[int, int]:
     """
     Estrategia minimax: elige la mejor acción usando el algoritmo minimax.
+
+    Consulta la tabla de jugadas precalculadas con la forma canónica del
+    estado y, si no figura, elige la jugada con la tabla de resultados.
     
     Args:
         tateti: Instancia de la clase Tateti
@@ -73,12 +222,50 @@ def estrategia_minimax(tateti: Tateti, estado: List[List[str]]) -> Tuple[int, in
         Tuple[int, int]: Acción elegida (fila, columna)
         
     Raises:
-        NotImplementedError: Hasta que el alumno implemente el algoritmo
+        ValueError: Si no hay acciones disponibles
+    """
+    estado_canonico, simetria = canonico(estado)
+    accion = JUGADAS.get(codificar(estado_canonico))
+    if accion is not None:
+        return accion_original(accion, simetria)
+    return elegir_jugada(tateti, estado)
+
+
+def elegir_jugada(tateti: Tateti, estado: Estado) -> Tuple[int, int]:
+    """
+    Elige la mejor acción según el valor minimax de cada sucesor.
+
+    Args:
+        tateti: Instancia de la clase Tateti
+        estado: Estado actual del tablero
+
+    Returns:
+        Tuple[int, int]: Acción elegida (fila, columna)
+
+    Raises:
+        ValueError: Si no hay acciones disponibles
     """
-    # TODO: Implementar algoritmo minimax
+    x, o = estado
+
+    # MAX maximiza la utilidad y MIN la minimiza: con el signo, ambos
+    # comparan sus sucesores de la misma forma
+    es_max = tateti.jugador(estado) == JUGADOR_MAX
+    signo = 1 if es_max else -1
 
-    # INSTRUCCIONES:
-    # 1. Eliminar la línea 'raise NotImplementedError...' de abajo
-    # 2. Implementar el algoritmo minimax aquí
-    # 3. La función debe retornar una tupla (fila, columna) con la mejor jugada
+    # El valor de cada sucesor sale de la tabla de resultados
+    mejor_accion = None
+    mejor_valor = -signo * float("inf")
+    for fila, columna in tateti.acciones(estado):
+        bit = 1 << (3 * fila + columna)
+        if es_max:
+            valor = _valor(x | bit, o)
+        else:
+            valor = _valor(x, o | bit)
+
+        if signo * valor > signo * mejor_valor:
+            mejor_accion, mejor_valor = (fila, columna), valor
+
+    if mejor_accion is None:
+        raise ValueError("No hay acciones disponibles")
 
+    return mejor_accion
@@ -0,0 +1,53 @@
+"""
+Genera minimax.json con la jugada óptima de cada estado de una partida.
+
+Recorre en profundidad todos los estados alcanzables desde el estado
+inicial y, para la forma canónica de cada uno que no sea terminal, guarda
+la acción elegida por minimax. estrategia_minimax carga el archivo al
+importarse.
+
+Ejecutar con: python generar_tabla.py
+"""
+
+import json
+from typing import Dict, List
+
+from tateti import Tateti, Estado, canonico, codificar
+from estrategias import ARCHIVO_JUGADAS, elegir_jugada
+
+
+def generar_jugadas(tateti: Tateti) -> Dict[int, List[int]]:
+    """
+    Calcula la jugada óptima de cada estado canónico no terminal alcanzable.
+
+    Args:
+        tateti: Instancia de la clase Tateti
+
+    Returns:
+        Dict[int, List[int]]: Acción [fila, columna] para cada clave codificar(estado)
+    """
+    jugadas: Dict[int, List[int]] = {}
+    pendientes = [tateti.estado_inicial]
+    while pendientes:
+        estado: Estado = pendientes.pop()
+        estado_canonico, _ = canonico(estado)
+        clave = codificar(estado_canonico)
+        if clave in jugadas or tateti.evaluar(estado)[0]:
+            continue
+        jugadas[clave] = list(elegir_jugada(tateti, estado_canonico))
+        for accion in tateti.acciones(estado):
+            pendientes.append(tateti.resultado(estado, accion))
+    return jugadas
+
+
+def main():
+    """Escribe la tabla de jugadas en ARCHIVO_JUGADAS"""
+    jugadas = generar_jugadas(Tateti())
+    with open(ARCHIVO_JUGADAS, "w", encoding="utf-8") as archivo:
+        json.dump({str(clave): jugadas[clave] for clave in sorted(jugadas)},
+                  archivo, separators=(",", ":"))
+    print(f"{len(jugadas)} jugadas guardadas en {ARCHIVO_JUGADAS}")
+
+
+if __name__ == "__main__":
+    main()
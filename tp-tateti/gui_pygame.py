@@ -4,8 +4,10 @@ Interfaz gráfica moderna para el juego de Tateti usando Pygame
 
 import pygame
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Tuple, Optional, List
-from tateti import Tateti
+from tateti import ESTADO_INICIAL, Tateti, casilla
 from estrategias import estrategia_aleatoria, estrategia_minimax
 
 # Configuración de colores (paleta moderna)
@@ -36,11 +38,25 @@ TOOLBAR_HEIGHT = 80
 BUTTON_HEIGHT = 40
 BUTTON_MARGIN = 10
 
+# Tiempo mínimo que se muestra "IA pensando..." antes de cada jugada (ms)
+AI_DELAY_MS = 500
+
+# Espera máxima por un evento cuando no hay nada que dibujar (ms)
+IDLE_TIMEOUT_MS = 100
+
 # Configuración de fuentes
 pygame.font.init()
 FONT_LARGE = pygame.font.Font(None, 48)
 FONT_MEDIUM = pygame.font.Font(None, 32)
 FONT_SMALL = pygame.font.Font(None, 24)
+FONTS = {'large': FONT_LARGE, 'medium': FONT_MEDIUM, 'small': FONT_SMALL}
+
+
+@lru_cache(maxsize=256)
+def render_text(font_id: str, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Renderiza un texto, reutilizando la superficie si ya se renderizó"""
+    return FONTS[font_id].render(text, True, color)
+
 
 class ModernTatetiGUI:
     def __init__(self):
@@ -51,7 +67,7 @@ class ModernTatetiGUI:
         
         # Estado del juego
         self.tateti = Tateti()
-        self.current_state = self.tateti.estado_inicial
+        self.current_state = ESTADO_INICIAL
         
         # Configuración de juego
         self.game_mode = 'human_vs_ai'  # Modo por defecto
@@ -68,6 +84,29 @@ class ModernTatetiGUI:
         self.dropdown_open = None  # 'mode' o 'strategy' si hay uno abierto
         self.thinking = False
         
+        # La IA elige su jugada en un hilo aparte para no congelar la ventana
+        self._ai_executor = ThreadPoolExecutor(max_workers=1)
+        self._ai_future: Optional[Future] = None
+        self._ai_started_at = 0
+        
+        # Indica si la pantalla cambió desde el último cuadro dibujado
+        self._needs_redraw = True
+        
+        # Cada cuadro se compone de dos capas: el fondo (barra, grilla y
+        # símbolos), que solo se vuelve a dibujar cuando cambia, y una capa
+        # transparente con la información y los desplegables, que se limpia
+        # en cada cuadro
+        self._background_layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self._background_key = None
+        self._overlay_layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        
+        # Partes estáticas de la interfaz, dibujadas una vez y reutilizadas
+        self._toolbar_surface = pygame.Surface((WINDOW_WIDTH, TOOLBAR_HEIGHT))
+        self._toolbar_key = None
+        self._grid_surface = self._render_grid()
+        self._x_surface = self._render_symbol(self._draw_x)
+        self._o_surface = self._render_symbol(self._draw_o)
+        
     def _create_buttons(self):
         """Crea los botones de la barra superior"""
         button_width = 200  # Botones aún más largos
@@ -108,8 +147,25 @@ class ModernTatetiGUI:
             ]
         }
         
+        # Tabla con el índice de la opción bajo cada fila de píxeles del
+        # menú (0xFF en los bordes y separaciones), para no dividir en
+        # cada movimiento del mouse
+        for dropdown in dropdowns.values():
+            y_to_idx = bytearray(b'\xff') * dropdown['rect'].height
+            for y in range(dropdown['rect'].height):
+                option_index = (y - 2) // (BUTTON_HEIGHT + 2)
+                if 0 <= option_index < len(dropdown['options']):
+                    y_to_idx[y] = option_index
+            dropdown['y_to_idx'] = bytes(y_to_idx)
+        
         return dropdowns
     
+    def _dropdown_option(self, dropdown: dict, pos: Tuple[int, int]) -> int:
+        """Índice de la opción del menú bajo el mouse, 0xFF si no hay ninguna"""
+        if not dropdown['rect'].collidepoint(pos):
+            return 0xFF
+        return dropdown['y_to_idx'][pos[1] - dropdown['rect'].y]
+    
     def _get_cell_from_pos(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
         """Convierte coordenadas de pantalla a posición de celda"""
         x, y = pos
@@ -123,7 +179,7 @@ class ModernTatetiGUI:
     
     def _draw_background(self):
         """Dibuja el fondo de la ventana"""
-        self.screen.fill(COLORS['background'])
+        self._background_layer.fill(COLORS['background'])
     
     def _draw_title(self):
         """Dibuja el título del juego (removido)"""
@@ -131,64 +187,94 @@ class ModernTatetiGUI:
     
     def _draw_toolbar(self):
         """Dibuja la barra de herramientas superior"""
+        # La barra solo cambia con el hover, el desplegable abierto y las
+        # opciones elegidas: se vuelve a dibujar cuando alguno cambia
+        key = (self.hovered_element, self.dropdown_open, self.game_mode, self.ai_strategy)
+        if key != self._toolbar_key:
+            self._render_toolbar(self._toolbar_surface)
+            self._toolbar_key = key
+        self._background_layer.blit(self._toolbar_surface, (0, 0))
+    
+    def _render_toolbar(self, surface: pygame.Surface):
+        """Dibuja la barra de herramientas sobre una superficie propia"""
         # Fondo de la barra de herramientas
         toolbar_rect = pygame.Rect(0, 0, WINDOW_WIDTH, TOOLBAR_HEIGHT)
-        pygame.draw.rect(self.screen, COLORS['grid'], toolbar_rect)
+        pygame.draw.rect(surface, COLORS['grid'], toolbar_rect)
         
         # Botón Nueva Partida
         new_game_rect = self.buttons['new_game']
         color = COLORS['success'] if self.hovered_element == 'new_game' else COLORS['button']
-        pygame.draw.rect(self.screen, color, new_game_rect, border_radius=12)
-        text = FONT_SMALL.render('Nueva Partida', True, COLORS['button_text'])
+        pygame.draw.rect(surface, color, new_game_rect, border_radius=12)
+        text = render_text('small', 'Nueva Partida', COLORS['button_text'])
         text_rect = text.get_rect(center=new_game_rect.center)
-        self.screen.blit(text, text_rect)
+        surface.blit(text, text_rect)
         
         # Botón Modo de Juego (desplegable)
         mode_rect = self.buttons['game_mode']
         color = COLORS['accent'] if self.hovered_element == 'game_mode' or self.dropdown_open == 'mode' else COLORS['button']
-        pygame.draw.rect(self.screen, color, mode_rect, border_radius=12)
+        pygame.draw.rect(surface, color, mode_rect, border_radius=12)
         
         mode_texts = {
             'human_vs_human': 'Humano vs Humano',
             'human_vs_ai': 'Humano vs IA',
             'ai_vs_ai': 'IA vs IA'
         }
-        text = FONT_SMALL.render(mode_texts[self.game_mode], True, COLORS['button_text'])
+        text = render_text('small', mode_texts[self.game_mode], COLORS['button_text'])
         text_rect = text.get_rect(center=(mode_rect.centerx - 8, mode_rect.centery))
-        self.screen.blit(text, text_rect)
+        surface.blit(text, text_rect)
         
         # Flecha desplegable
         arrow_x = mode_rect.right - 15
         arrow_y = mode_rect.centery
         points = [(arrow_x, arrow_y - 4), (arrow_x + 8, arrow_y - 4), (arrow_x + 4, arrow_y + 4)]
-        pygame.draw.polygon(self.screen, COLORS['button_text'], points)
+        pygame.draw.polygon(surface, COLORS['button_text'], points)
         
         # Botón Estrategia IA (desplegable)
         strategy_rect = self.buttons['ai_strategy']
         color = COLORS['accent'] if self.hovered_element == 'ai_strategy' or self.dropdown_open == 'strategy' else COLORS['button']
-        pygame.draw.rect(self.screen, color, strategy_rect, border_radius=12)
+        pygame.draw.rect(surface, color, strategy_rect, border_radius=12)
         
         strategy_texts = {
             'aleatoria': 'Estrategia Aleatoria',
             'minimax': 'Algoritmo Minimax'
         }
-        text = FONT_SMALL.render(strategy_texts[self.ai_strategy], True, COLORS['button_text'])
+        text = render_text('small', strategy_texts[self.ai_strategy], COLORS['button_text'])
         text_rect = text.get_rect(center=(strategy_rect.centerx - 8, strategy_rect.centery))
-        self.screen.blit(text, text_rect)
+        surface.blit(text, text_rect)
         
         # Flecha desplegable
         arrow_x = strategy_rect.right - 15
         arrow_y = strategy_rect.centery
         points = [(arrow_x, arrow_y - 4), (arrow_x + 8, arrow_y - 4), (arrow_x + 4, arrow_y + 4)]
-        pygame.draw.polygon(self.screen, COLORS['button_text'], points)
+        pygame.draw.polygon(surface, COLORS['button_text'], points)
+    
+    def _draw_frame(self):
+        """Compone el cuadro en pantalla a partir de las dos capas"""
+        # El fondo solo cambia con la barra de herramientas y el tablero
+        key = (self.hovered_element, self.dropdown_open, self.game_mode,
+               self.ai_strategy, self.current_state)
+        if key != self._background_key:
+            self._draw_background()
+            self._draw_toolbar()
+            self._draw_title()
+            self._draw_grid()
+            self._draw_symbols()
+            self._background_key = key
+        
+        self._overlay_layer.fill((0, 0, 0, 0))
+        self._draw_game_info()
+        self._draw_dropdowns()  # Los dropdowns se dibujan al final para estar encima
+        
+        self.screen.blit(self._background_layer, (0, 0))
+        self.screen.blit(self._overlay_layer, (0, 0))
     
     def _draw_dropdowns(self):
         """Dibuja los menús desplegables si están abiertos"""
         if self.dropdown_open == 'mode':
             dropdown = self.dropdowns['mode']
             # Fondo del dropdown
-            pygame.draw.rect(self.screen, COLORS['background'], dropdown['rect'], border_radius=12)
-            pygame.draw.rect(self.screen, COLORS['grid'], dropdown['rect'], 2, border_radius=12)
+            pygame.draw.rect(self._overlay_layer, COLORS['background'], dropdown['rect'], border_radius=12)
+            pygame.draw.rect(self._overlay_layer, COLORS['grid'], dropdown['rect'], 2, border_radius=12)
             
             # Opciones
             for i, (value, label) in enumerate(dropdown['options']):
@@ -201,21 +287,21 @@ class ModernTatetiGUI:
                 
                 # Resaltar opción seleccionada o hover
                 if value == self.game_mode:
-                    pygame.draw.rect(self.screen, COLORS['accent'], option_rect, border_radius=8)
+                    pygame.draw.rect(self._overlay_layer, COLORS['accent'], option_rect, border_radius=8)
                 elif self.hovered_element == f'mode_{value}':
-                    pygame.draw.rect(self.screen, COLORS['button_hover'], option_rect, border_radius=8)
+                    pygame.draw.rect(self._overlay_layer, COLORS['button_hover'], option_rect, border_radius=8)
                 
                 # Texto de la opción
                 text_color = COLORS['button_text'] if (value == self.game_mode or self.hovered_element == f'mode_{value}') else COLORS['text']
-                text = FONT_SMALL.render(label, True, text_color)
+                text = render_text('small', label, text_color)
                 text_rect = text.get_rect(center=option_rect.center)
-                self.screen.blit(text, text_rect)
+                self._overlay_layer.blit(text, text_rect)
         
         elif self.dropdown_open == 'strategy':
             dropdown = self.dropdowns['strategy']
             # Fondo del dropdown
-            pygame.draw.rect(self.screen, COLORS['background'], dropdown['rect'], border_radius=12)
-            pygame.draw.rect(self.screen, COLORS['grid'], dropdown['rect'], 2, border_radius=12)
+            pygame.draw.rect(self._overlay_layer, COLORS['background'], dropdown['rect'], border_radius=12)
+            pygame.draw.rect(self._overlay_layer, COLORS['grid'], dropdown['rect'], 2, border_radius=12)
             
             # Opciones
             for i, (value, label) in enumerate(dropdown['options']):
@@ -228,36 +314,43 @@ class ModernTatetiGUI:
                 
                 # Resaltar opción seleccionada o hover
                 if value == self.ai_strategy:
-                    pygame.draw.rect(self.screen, COLORS['accent'], option_rect, border_radius=8)
+                    pygame.draw.rect(self._overlay_layer, COLORS['accent'], option_rect, border_radius=8)
                 elif self.hovered_element == f'strategy_{value}':
-                    pygame.draw.rect(self.screen, COLORS['button_hover'], option_rect, border_radius=8)
+                    pygame.draw.rect(self._overlay_layer, COLORS['button_hover'], option_rect, border_radius=8)
                 
                 # Texto de la opción
                 text_color = COLORS['button_text'] if (value == self.ai_strategy or self.hovered_element == f'strategy_{value}') else COLORS['text']
-                text = FONT_SMALL.render(label, True, text_color)
+                text = render_text('small', label, text_color)
                 text_rect = text.get_rect(center=option_rect.center)
-                self.screen.blit(text, text_rect)
+                self._overlay_layer.blit(text, text_rect)
     
     def _draw_grid(self):
         """Dibuja la grilla del tateti"""
         # Mostrar siempre la grilla, no solo cuando el juego está activo
+        self._background_layer.blit(self._grid_surface, (GRID_OFFSET_X - 10, GRID_OFFSET_Y - 10))
+    
+    def _render_grid(self) -> pygame.Surface:
+        """Dibuja la grilla, que nunca cambia, sobre una superficie propia"""
+        surface = pygame.Surface((GRID_SIZE + 20, GRID_SIZE + 20))
+        surface.fill(COLORS['background'])
         
         # Fondo de la grilla
-        grid_rect = pygame.Rect(GRID_OFFSET_X - 10, GRID_OFFSET_Y - 10, GRID_SIZE + 20, GRID_SIZE + 20)
-        pygame.draw.rect(self.screen, COLORS['grid'], grid_rect, border_radius=12)
+        pygame.draw.rect(surface, COLORS['grid'], surface.get_rect(), border_radius=12)
         
         # Líneas de la grilla
         line_width = 4
         for i in range(1, 3):
             # Líneas verticales
-            start_pos = (GRID_OFFSET_X + i * CELL_SIZE, GRID_OFFSET_Y)
-            end_pos = (GRID_OFFSET_X + i * CELL_SIZE, GRID_OFFSET_Y + GRID_SIZE)
-            pygame.draw.line(self.screen, COLORS['background'], start_pos, end_pos, line_width)
+            start_pos = (10 + i * CELL_SIZE, 10)
+            end_pos = (10 + i * CELL_SIZE, 10 + GRID_SIZE)
+            pygame.draw.line(surface, COLORS['background'], start_pos, end_pos, line_width)
             
             # Líneas horizontales
-            start_pos = (GRID_OFFSET_X, GRID_OFFSET_Y + i * CELL_SIZE)
-            end_pos = (GRID_OFFSET_X + GRID_SIZE, GRID_OFFSET_Y + i * CELL_SIZE)
-            pygame.draw.line(self.screen, COLORS['background'], start_pos, end_pos, line_width)
+            start_pos = (10, 10 + i * CELL_SIZE)
+            end_pos = (10 + GRID_SIZE, 10 + i * CELL_SIZE)
+            pygame.draw.line(surface, COLORS['background'], start_pos, end_pos, line_width)
+        
+        return surface
     
     def _draw_symbols(self):
         """Dibuja las X y O en el tablero"""
@@ -265,17 +358,22 @@ class ModernTatetiGUI:
         
         for i in range(3):
             for j in range(3):
-                symbol = self.current_state[i][j]
-                if symbol != '-':
-                    center_x = GRID_OFFSET_X + j * CELL_SIZE + CELL_SIZE // 2
-                    center_y = GRID_OFFSET_Y + i * CELL_SIZE + CELL_SIZE // 2
-                    
-                    if symbol == 'X':
-                        self._draw_x(center_x, center_y)
-                    elif symbol == 'O':
-                        self._draw_o(center_x, center_y)
+                symbol = casilla(self.current_state, i, j)
+                if symbol == 'X':
+                    glyph = self._x_surface
+                elif symbol == 'O':
+                    glyph = self._o_surface
+                else:
+                    continue
+                self._background_layer.blit(glyph, (GRID_OFFSET_X + j * CELL_SIZE, GRID_OFFSET_Y + i * CELL_SIZE))
+    
+    def _render_symbol(self, draw) -> pygame.Surface:
+        """Dibuja un símbolo centrado sobre una superficie transparente del tamaño de una celda"""
+        surface = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+        draw(surface, CELL_SIZE // 2, CELL_SIZE // 2)
+        return surface
     
-    def _draw_x(self, center_x: int, center_y: int):
+    def _draw_x(self, surface: pygame.Surface, center_x: int, center_y: int):
         """Dibuja una X moderna"""
         size = 40
         thickness = 6
@@ -283,18 +381,18 @@ class ModernTatetiGUI:
         # Línea diagonal 1
         start1 = (center_x - size, center_y - size)
         end1 = (center_x + size, center_y + size)
-        pygame.draw.line(self.screen, COLORS['x_color'], start1, end1, thickness)
+        pygame.draw.line(surface, COLORS['x_color'], start1, end1, thickness)
         
         # Línea diagonal 2
         start2 = (center_x + size, center_y - size)
         end2 = (center_x - size, center_y + size)
-        pygame.draw.line(self.screen, COLORS['x_color'], start2, end2, thickness)
+        pygame.draw.line(surface, COLORS['x_color'], start2, end2, thickness)
     
-    def _draw_o(self, center_x: int, center_y: int):
+    def _draw_o(self, surface: pygame.Surface, center_x: int, center_y: int):
         """Dibuja una O moderna"""
         radius = 40
         thickness = 6
-        pygame.draw.circle(self.screen, COLORS['o_color'], (center_x, center_y), radius, thickness)
+        pygame.draw.circle(surface, COLORS['o_color'], (center_x, center_y), radius, thickness)
     
     def _draw_game_info(self):
         """Dibuja información del juego"""
@@ -324,9 +422,9 @@ class ModernTatetiGUI:
                 text = "¡Empate!"
                 color = COLORS['warning']
         
-        rendered_text = FONT_MEDIUM.render(text, True, color)
+        rendered_text = render_text('medium', text, color)
         text_rect = rendered_text.get_rect(center=(WINDOW_WIDTH // 2, info_y))
-        self.screen.blit(rendered_text, text_rect)
+        self._overlay_layer.blit(rendered_text, text_rect)
         
         # Información del modo y estrategia
         if self.game_active:
@@ -341,14 +439,14 @@ class ModernTatetiGUI:
                 'minimax': 'Estrategia: Minimax'
             }
             
-            mode_info = FONT_SMALL.render(mode_text[self.game_mode], True, COLORS['text'])
+            mode_info = render_text('small', mode_text[self.game_mode], COLORS['text'])
             mode_rect = mode_info.get_rect(center=(WINDOW_WIDTH // 2, info_y + 35))
-            self.screen.blit(mode_info, mode_rect)
+            self._overlay_layer.blit(mode_info, mode_rect)
             
             if self.game_mode in ['human_vs_ai', 'ai_vs_ai']:
-                strategy_info = FONT_SMALL.render(strategy_text[self.ai_strategy], True, COLORS['text'])
+                strategy_info = render_text('small', strategy_text[self.ai_strategy], COLORS['text'])
                 strategy_rect = strategy_info.get_rect(center=(WINDOW_WIDTH // 2, info_y + 55))
-                self.screen.blit(strategy_info, strategy_rect)
+                self._overlay_layer.blit(strategy_info, strategy_rect)
     
     def _handle_button_click(self, pos: Tuple[int, int]):
         """Maneja los clics en botones y dropdowns"""
@@ -368,9 +466,8 @@ class ModernTatetiGUI:
             dropdown = self.dropdowns['mode']
             if dropdown['rect'].collidepoint(pos):
                 # Determinar qué opción se clickeó
-                rel_y = pos[1] - dropdown['rect'].y - 2
-                option_index = rel_y // (BUTTON_HEIGHT + 2)
-                if 0 <= option_index < len(dropdown['options']):
+                option_index = self._dropdown_option(dropdown, pos)
+                if option_index != 0xFF:
                     value, _ = dropdown['options'][option_index]
                     self.game_mode = value
                     self.dropdown_open = None
@@ -382,9 +479,8 @@ class ModernTatetiGUI:
             dropdown = self.dropdowns['strategy']
             if dropdown['rect'].collidepoint(pos):
                 # Determinar qué opción se clickeó
-                rel_y = pos[1] - dropdown['rect'].y - 2
-                option_index = rel_y // (BUTTON_HEIGHT + 2)
-                if 0 <= option_index < len(dropdown['options']):
+                option_index = self._dropdown_option(dropdown, pos)
+                if option_index != 0xFF:
                     value, _ = dropdown['options'][option_index]
                     self.ai_strategy = value
                     self.dropdown_open = None
@@ -400,8 +496,9 @@ class ModernTatetiGUI:
         self.game_active = True
         self.game_over = False
         self.winner = None
-        self.current_state = self.tateti.estado_inicial
+        self.current_state = ESTADO_INICIAL
         self.dropdown_open = None
+        self._cancel_ai_move()
         
         # Configurar jugador humano según el modo
         if self.game_mode == 'human_vs_ai':
@@ -414,8 +511,8 @@ class ModernTatetiGUI:
         self.game_active = False
         self.game_over = False
         self.winner = None
-        self.current_state = self.tateti.estado_inicial
-        self.thinking = False
+        self.current_state = ESTADO_INICIAL
+        self._cancel_ai_move()
     
     def _handle_cell_click(self, pos: Tuple[int, int]):
         """Maneja los clics en las celdas del tablero"""
@@ -439,13 +536,14 @@ class ModernTatetiGUI:
     def _make_move(self, action: Tuple[int, int]):
         """Ejecuta una jugada"""
         self.current_state = self.tateti.resultado(self.current_state, action)
+        self._needs_redraw = True
         
         # Verificar si el juego terminó
-        if self.tateti.test_terminal(self.current_state):
+        terminal, utility = self.tateti.evaluar(self.current_state)
+        if terminal:
             self.game_over = True
             
-            # La función utilidad siempre es desde la perspectiva de MAX (X)
-            utility = self.tateti.utilidad(self.current_state)
+            # La utilidad siempre es desde la perspectiva de MAX (X)
             if utility == 1.0:
                 self.winner = 'X'  # MAX ganó
             elif utility == 0.0:
@@ -453,9 +551,21 @@ class ModernTatetiGUI:
             # Si utility == 0.5, es empate (winner queda None)
     
     def _ai_move(self):
-        """Ejecuta una jugada de la IA"""
+        """Lanza la jugada de la IA o, si ya terminó de elegirla, la ejecuta"""
+        if self._ai_future is not None:
+            # Mostrar "pensando" al menos AI_DELAY_MS, sin bloquear el loop
+            elapsed = pygame.time.get_ticks() - self._ai_started_at
+            if self._ai_future.done() and elapsed >= AI_DELAY_MS:
+                action = self._ai_future.result()
+                self._ai_future = None
+                self.thinking = False
+                self._needs_redraw = True
+                if action:
+                    self._make_move(action)
+            return
+        
         if (not self.game_active or self.game_over or 
-            self.thinking or self.game_mode == 'human_vs_human'):
+            self.game_mode == 'human_vs_human'):
             return
             
         current_player = self.tateti.jugador(self.current_state)
@@ -465,27 +575,22 @@ class ModernTatetiGUI:
             current_player == self.human_player):
             return
             
-        self.thinking = True
-        pygame.display.flip()  # Actualizar pantalla para mostrar "pensando"
-        
-        # Pequeña pausa para efecto visual
-        pygame.time.wait(500)
-        
-        # Elegir acción usando la estrategia seleccionada
+        # Elegir acción usando la estrategia seleccionada, en segundo plano
         if self.ai_strategy == 'aleatoria':
-            action = estrategia_aleatoria(self.tateti, self.current_state)
+            strategy = estrategia_aleatoria
         else:  # minimax
-            try:
-                action = estrategia_minimax(self.tateti, self.current_state)
-            except NotImplementedError as e:
-                # Si minimax no está implementado, mostrar mensaje y cerrar
-                print(str(e))
-                pygame.quit()
-                sys.exit(1)
-        
-        if action:
-            self._make_move(action)
-            
+            strategy = estrategia_minimax
+        
+        self.thinking = True
+        self._needs_redraw = True
+        self._ai_started_at = pygame.time.get_ticks()
+        self._ai_future = self._ai_executor.submit(strategy, self.tateti, self.current_state)
+    
+    def _cancel_ai_move(self):
+        """Descarta la jugada de la IA en curso, si la hay"""
+        if self._ai_future is not None:
+            self._ai_future.cancel()
+            self._ai_future = None
         self.thinking = False
     
     def _update_hover(self, pos: Tuple[int, int]):
@@ -501,29 +606,36 @@ class ModernTatetiGUI:
         # Verificar hover en dropdowns abiertos
         if self.dropdown_open == 'mode':
             dropdown = self.dropdowns['mode']
-            if dropdown['rect'].collidepoint(pos):
-                rel_y = pos[1] - dropdown['rect'].y - 2
-                option_index = rel_y // (BUTTON_HEIGHT + 2)
-                if 0 <= option_index < len(dropdown['options']):
-                    value, _ = dropdown['options'][option_index]
-                    self.hovered_element = f'mode_{value}'
+            option_index = self._dropdown_option(dropdown, pos)
+            if option_index != 0xFF:
+                value, _ = dropdown['options'][option_index]
+                self.hovered_element = f'mode_{value}'
         
         elif self.dropdown_open == 'strategy':
             dropdown = self.dropdowns['strategy']
-            if dropdown['rect'].collidepoint(pos):
-                rel_y = pos[1] - dropdown['rect'].y - 2
-                option_index = rel_y // (BUTTON_HEIGHT + 2)
-                if 0 <= option_index < len(dropdown['options']):
-                    value, _ = dropdown['options'][option_index]
-                    self.hovered_element = f'strategy_{value}'
+            option_index = self._dropdown_option(dropdown, pos)
+            if option_index != 0xFF:
+                value, _ = dropdown['options'][option_index]
+                self.hovered_element = f'strategy_{value}'
     
     def run(self):
         """Loop principal del juego"""
         running = True
         
         while running:
+            # Sin nada nuevo que dibujar ni jugada de la IA en curso, dormir
+            # hasta el próximo evento (o hasta el timeout, para revisar si le
+            # toca a la IA) en lugar de redibujar a 60 fps
+            if self._needs_redraw or self._ai_future is not None:
+                events = pygame.event.get()
+            else:
+                events = [pygame.event.wait(IDLE_TIMEOUT_MS)] + pygame.event.get()
+            
             # Manejar eventos
-            for event in pygame.event.get():
+            for event in events:
+                if event.type == pygame.NOEVENT:
+                    continue
+                
                 if event.type == pygame.QUIT:
                     running = False
                     
@@ -533,22 +645,26 @@ class ModernTatetiGUI:
                         self._handle_cell_click(event.pos)
                         
                 elif event.type == pygame.MOUSEMOTION:
+                    # El movimiento del mouse solo redibuja si cambia el hover
+                    hovered = self.hovered_element
                     self._update_hover(event.pos)
+                    if self.hovered_element == hovered:
+                        continue
+                
+                self._needs_redraw = True
             
             # Lógica de la IA
             self._ai_move()
             
-            # Dibujar todo
-            self._draw_background()
-            self._draw_toolbar()
-            self._draw_title()
-            self._draw_grid()
-            self._draw_symbols()
-            self._draw_game_info()
-            self._draw_dropdowns()  # Los dropdowns se dibujan al final para estar encima
+            # Dibujar todo, solo si algo cambió desde el último cuadro
+            if self._needs_redraw:
+                self._draw_frame()
+                pygame.display.flip()
+                self._needs_redraw = False
             
-            pygame.display.flip()
-            self.clock.tick(60)
+            if self._ai_future is not None:
+                self.clock.tick(60)
         
+        self._ai_executor.shutdown(wait=False, cancel_futures=True)
         pygame.quit()
         sys.exit()
@@ -1,192 +1,415 @@
 """
 Módulo para la formulación del juego del Tateti (Tic-Tac-Toe)
 
-Estados: Matriz 3x3 con "X", "O" y "-" (casilla vacía)
+Estados: Par de máscaras de 9 bits (x, o) con las casillas de cada jugador;
+         la casilla (fila, columna) corresponde al bit 3 * fila + columna
 Acciones: Par ordenado (fila, columna)
 Jugadores: "MAX" (X) y "MIN" (O)
 Utilidad: 1 (gana), 0 (pierde), 0.5 (empate)
 """
 
-import copy
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import List, Sequence, Tuple, Optional
 
 # Constantes del juego
 JUGADOR_MAX = "X"
 JUGADOR_MIN = "O"
 CASILLA_VACIA = "-"
 
+# Los estados son inmutables: cada jugada arma un par de máscaras nuevo
+Estado = Tuple[int, int]
+
+# Tablero vacío: al ser inmutable, todas las partidas comparten el mismo
+ESTADO_INICIAL: Estado = (0, 0)
+
+TABLERO_LLENO = 0b111_111_111
+
+# Posición (fila, columna) de cada índice de casilla
+IDX2RC = tuple((i // 3, i % 3) for i in range(9))
+
+# Las 8 líneas ganadoras (filas, columnas y diagonales) como máscaras de bits
+LINEAS_GANADORAS = (
+    0b000_000_111, 0b000_111_000, 0b111_000_000,
+    0b001_001_001, 0b010_010_010, 0b100_100_100,
+    0b100_010_001, 0b001_010_100,
+)
+
+# Para cada máscara de 9 bits, 1 si sus casillas completan alguna línea:
+# el control de ganador es una sola consulta en lugar de recorrer las 8
+HAY_LINEA = bytes(
+    any(mascara & linea == linea for linea in LINEAS_GANADORAS)
+    for mascara in range(512)
+)
+
+
+def _destinos(transformar) -> Tuple[int, ...]:
+    """
+    Casilla imagen de cada casilla bajo una simetría del tablero.
+
+    Args:
+        transformar: Función que lleva (fila, columna) a su casilla imagen
+
+    Returns:
+        Tuple[int, ...]: Índice 3 * fila + columna de la imagen de cada casilla
+    """
+    destinos = []
+    for i in range(9):
+        fila, columna = transformar(i // 3, i % 3)
+        destinos.append(3 * fila + columna)
+    return tuple(destinos)
+
+
+def _tabla_simetria(destinos: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Precalcula la imagen de cada máscara de 9 bits bajo una simetría.
+
+    Args:
+        destinos: Casilla imagen de cada casilla
+
+    Returns:
+        Tuple[int, ...]: Tabla de 512 entradas, mascara -> mascara transformada
+    """
+    tabla = []
+    for mascara in range(512):
+        imagen = 0
+        for i in range(9):
+            if mascara >> i & 1:
+                imagen |= 1 << destinos[i]
+        tabla.append(imagen)
+    return tuple(tabla)
+
+
+# Las 8 simetrías del tablero (4 rotaciones y sus reflexiones) como
+# permutaciones de las casillas, y sus tablas sobre máscaras completas
+DESTINOS = tuple(_destinos(t) for t in (
+    lambda f, c: (f, c),
+    lambda f, c: (c, 2 - f),
+    lambda f, c: (2 - f, 2 - c),
+    lambda f, c: (2 - c, f),
+    lambda f, c: (f, 2 - c),
+    lambda f, c: (c, f),
+    lambda f, c: (2 - f, c),
+    lambda f, c: (2 - c, 2 - f),
+))
+SIMETRIAS = tuple(_tabla_simetria(destinos) for destinos in DESTINOS)
+
+# Permutaciones inversas, para volver de una casilla imagen a la original
+ORIGENES = tuple(
+    tuple(destinos.index(i) for i in range(9)) for destinos in DESTINOS
+)
+
+
+@lru_cache(maxsize=None)
+def canonico(estado: Estado) -> Tuple[Estado, int]:
+    """
+    Forma canónica de un estado: el menor entre sus 8 simétricos.
+
+    Los estados simétricos tienen el mismo valor, así que las tablas y la
+    búsqueda pueden compartir una sola entrada para todos ellos. Hay pocos
+    estados posibles, así que el resultado de cada uno se guarda.
+
+    Args:
+        estado: Estado del tablero
+
+    Returns:
+        Estado: Estado canónico
+        int: Índice en SIMETRIAS de la simetría que lleva al canónico
+    """
+    x, o = estado
+    return min(((tabla[x], tabla[o]), k) for k, tabla in enumerate(SIMETRIAS))
+
+
+def accion_original(accion: Tuple[int, int], simetria: int) -> Tuple[int, int]:
+    """
+    Deshace una simetría sobre una acción del estado canónico.
+
+    Args:
+        accion: Acción (fila, columna) sobre el estado canónico
+        simetria: Simetría devuelta por canonico
+
+    Returns:
+        Tuple[int, int]: Acción equivalente sobre el estado original
+    """
+    fila, columna = accion
+    return divmod(ORIGENES[simetria][3 * fila + columna], 3)
+
+
+def desde_tablero(tablero: Sequence[Sequence[str]]) -> Estado:
+    """
+    Convierte un tablero 3x3 de "X", "O" y "-" en un estado.
+
+    Args:
+        tablero: Filas del tablero
+
+    Returns:
+        Estado: Máscaras con las casillas de MAX (X) y de MIN (O)
+    """
+    x = o = 0
+    for fila in range(3):
+        for columna in range(3):
+            if tablero[fila][columna] == JUGADOR_MAX:
+                x |= 1 << (3 * fila + columna)
+            elif tablero[fila][columna] == JUGADOR_MIN:
+                o |= 1 << (3 * fila + columna)
+    return x, o
+
+
+def codificar(estado: Estado) -> int:
+    """
+    Empaqueta un estado en un solo entero de 18 bits, x | o << 9.
+
+    Sirve de clave compacta para tablas y archivos: se compara y se hashea
+    como un entero, sin armar tuplas.
+
+    Args:
+        estado: Estado del tablero
+
+    Returns:
+        int: Código del estado
+    """
+    return estado[0] | estado[1] << 9
+
+
+def decodificar(codigo: int) -> Estado:
+    """
+    Recupera el estado empaquetado por codificar.
+
+    Args:
+        codigo: Código del estado
+
+    Returns:
+        Estado: Máscaras con las casillas de MAX y de MIN
+    """
+    return codigo & TABLERO_LLENO, codigo >> 9
+
+
+def casilla(estado: Estado, fila: int, columna: int) -> str:
+    """
+    Contenido de una casilla del estado.
+
+    Args:
+        estado: Estado del tablero
+        fila: Fila de la casilla
+        columna: Columna de la casilla
+
+    Returns:
+        str: JUGADOR_MAX, JUGADOR_MIN o CASILLA_VACIA
+    """
+    bit = 1 << (3 * fila + columna)
+    if estado[0] & bit:
+        return JUGADOR_MAX
+    if estado[1] & bit:
+        return JUGADOR_MIN
+    return CASILLA_VACIA
+
+
+def jugador(estado: Estado) -> str:
+    """
+    Determina qué jugador debe mover en el estado dado.
+
+    En tateti, MAX (X) siempre empieza. Contamos las fichas para determinar
+    el turno actual.
+
+    Args:
+        estado: Estado actual del tablero
+
+    Returns:
+        str: JUGADOR_MAX si es turno de MAX, JUGADOR_MIN si es turno de MIN
+    """
+    x, o = estado
+
+    # Si hay más X que O, es turno de MIN
+    # Sino, es turno de MAX
+    return JUGADOR_MIN if x.bit_count() > o.bit_count() else JUGADOR_MAX
+
+
+def acciones(estado: Estado) -> List[Tuple[int, int]]:
+    """
+    Retorna todas las acciones posibles en el estado dado.
+
+    Args:
+        estado: Estado actual del tablero
+
+    Returns:
+        List[Tuple[int, int]]: Lista de pares (fila, columna) de casillas vacías
+    """
+    libres = ~(estado[0] | estado[1]) & TABLERO_LLENO
+    acciones_posibles = []
+    while libres:
+        bit = libres & -libres
+        acciones_posibles.append(IDX2RC[bit.bit_length() - 1])
+        libres ^= bit
+    return acciones_posibles
+
+
+def num_acciones(estado: Estado) -> int:
+    """
+    Cuenta las acciones posibles sin armar la lista.
+
+    Args:
+        estado: Estado actual del tablero
+
+    Returns:
+        int: Cantidad de casillas vacías
+    """
+    return (TABLERO_LLENO ^ (estado[0] | estado[1])).bit_count()
+
+
+def resultado(estado: Estado, accion: Tuple[int, int]) -> Estado:
+    """
+    Retorna el estado resultante de aplicar la acción al estado dado.
+
+    Args:
+        estado: Estado actual del tablero
+        accion: Par (fila, columna) donde colocar la ficha
+
+    Returns:
+        Estado: Nuevo estado después de aplicar la acción
+
+    Raises:
+        ValueError: Si la acción no es válida
+    """
+    fila, columna = accion
+
+    # Validar que la acción sea válida
+    if not (0 <= fila < 3 and 0 <= columna < 3):
+        raise ValueError(f"Acción inválida: {accion}. Debe estar en rango [0,2]")
+
+    x, o = estado
+    bit = 1 << (3 * fila + columna)
+    if (x | o) & bit:
+        raise ValueError(f"Casilla ({fila}, {columna}) ya está ocupada")
+
+    # Crear nuevo estado con la ficha del jugador de turno
+    if jugador(estado) == JUGADOR_MAX:
+        return (x | bit, o)
+    return (x, o | bit)
+
+
+def evaluar(estado: Estado) -> Tuple[bool, Optional[float]]:
+    """
+    Determina en una sola pasada si el estado es terminal y su utilidad.
+
+    Args:
+        estado: Estado del tablero a evaluar
+
+    Returns:
+        bool: True si el juego terminó, False si continúa
+        Optional[float]: Utilidad para MAX (1.0, 0.0 o 0.5 si empate),
+        None si el juego continúa
+    """
+    ganador = _hay_ganador(estado)
+    if ganador == JUGADOR_MAX:
+        return True, 1.0
+    if ganador == JUGADOR_MIN:
+        return True, 0.0
+
+    # Sin ganador, termina en empate si el tablero está lleno
+    if estado[0] | estado[1] == TABLERO_LLENO:
+        return True, 0.5
+    return False, None
+
+
+def test_terminal(estado: Estado) -> bool:
+    """
+    Determina si el estado es terminal (juego terminado).
+
+    Un estado es terminal si:
+    1. Hay un ganador (tres en línea)
+    2. No hay un ganador y el tablero está lleno (empate)
+
+    Args:
+        estado: Estado del tablero a evaluar
+
+    Returns:
+        bool: True si el juego terminó, False si continúa
+    """
+    return evaluar(estado)[0]
+
+
+def utilidad(estado: Estado, jugador: str = JUGADOR_MAX) -> float:
+    """
+    Calcula la utilidad de un estado terminal desde la perspectiva del jugador especificado.
+
+    Args:
+        estado: Estado terminal del juego
+        jugador: Jugador desde cuya perspectiva calcular la utilidad (por defecto JUGADOR_MAX)
+
+    Returns:
+        float: 1.0 si el jugador gana, 0.0 si el jugador pierde, 0.5 si empate
+
+    Raises:
+        ValueError: Si el estado no es terminal
+    """
+    terminal, utilidad_max = evaluar(estado)
+    if not terminal:
+        raise ValueError("No se puede calcular utilidad en estado no terminal")
+    # evaluar solo devuelve None para estados no terminales
+    assert utilidad_max is not None
+
+    return utilidad_max if jugador == JUGADOR_MAX else 1.0 - utilidad_max
+
+
+def _hay_ganador(estado: Estado) -> Optional[str]:
+    """
+    Función auxiliar para verificar si hay un ganador.
+
+    Args:
+        estado: Estado del tablero
+
+    Returns:
+        Optional[str]: El jugador ganador ("X" o "O") o None si no hay ganador
+    """
+    # Verificar filas, columnas y diagonales de cada jugador
+    x, o = estado
+    if HAY_LINEA[x]:
+        return JUGADOR_MAX
+    if HAY_LINEA[o]:
+        return JUGADOR_MIN
+
+    return None
+
+
+def mostrar_tablero(estado: Estado) -> str:
+    """
+    Función auxiliar para mostrar el tablero de forma legible.
+
+    Args:
+        estado: Estado del tablero
+
+    Returns:
+        str: Representación visual del tablero
+    """
+    resultado = "\n  0   1   2\n"
+    for i in range(3):
+        resultado += f"{i} "
+        for j in range(3):
+            resultado += f" {casilla(estado, i, j)} "
+            if j < 2:
+                resultado += "|"
+        resultado += "\n"
+        if i < 2:
+            resultado += "  -----------\n"
+    return resultado
+
 
 class Tateti:
-    """Clase que encapsula toda la lógica del juego Tateti"""
+    """
+    Clase que encapsula toda la lógica del juego Tateti.
     
-    def __init__(self):
-        """Inicializa el juego con el estado inicial"""
-        self.estado_inicial = [[CASILLA_VACIA for _ in range(3)] for _ in range(3)]
-
-    def jugador(self, estado: List[List[str]]) -> str:
-        """
-        Determina qué jugador debe mover en el estado dado.
-        
-        En tateti, MAX (X) siempre empieza. Contamos las fichas para determinar
-        el turno actual.
-        
-        Args:
-            estado: Estado actual del tablero
-            
-        Returns:
-            str: JUGADOR_MAX si es turno de MAX, JUGADOR_MIN si es turno de MIN
-        """
-        contador_x = sum(fila.count(JUGADOR_MAX) for fila in estado)
-        contador_o = sum(fila.count(JUGADOR_MIN) for fila in estado)
-        
-        # Si hay más X que O, es turno de MIN
-        # Sino, es turno de MAX
-        return JUGADOR_MIN if contador_x > contador_o else JUGADOR_MAX
-
-    def acciones(self, estado: List[List[str]]) -> List[Tuple[int, int]]:
-        """
-        Retorna todas las acciones posibles en el estado dado.
-        
-        Args:
-            estado: Estado actual del tablero
-            
-        Returns:
-            List[Tuple[int, int]]: Lista de pares (fila, columna) de casillas vacías
-        """
-        acciones_posibles = []
-        for fila in range(3):
-            for columna in range(3):
-                if estado[fila][columna] == CASILLA_VACIA:
-                    acciones_posibles.append((fila, columna))
-        return acciones_posibles
-
-    def resultado(self, estado: List[List[str]], accion: Tuple[int, int]) -> List[List[str]]:
-        """
-        Retorna el estado resultante de aplicar la acción al estado dado.
-        
-        Args:
-            estado: Estado actual del tablero
-            accion: Par (fila, columna) donde colocar la ficha
-            
-        Returns:
-            List[List[str]]: Nuevo estado después de aplicar la acción
-            
-        Raises:
-            ValueError: Si la acción no es válida
-        """
-        fila, columna = accion
-        
-        # Validar que la acción sea válida
-        if not (0 <= fila < 3 and 0 <= columna < 3):
-            raise ValueError(f"Acción inválida: {accion}. Debe estar en rango [0,2]")
-        
-        if estado[fila][columna] != CASILLA_VACIA:
-            raise ValueError(f"Casilla ({fila}, {columna}) ya está ocupada")
-        
-        # Crear nuevo estado
-        nuevo_estado = copy.deepcopy(estado)
-        nuevo_estado[fila][columna] = self.jugador(estado)
-        
-        return nuevo_estado
-
-    def test_terminal(self, estado: List[List[str]]) -> bool:
-        """
-        Determina si el estado es terminal (juego terminado).
-        
-        Un estado es terminal si:
-        1. Hay un ganador (tres en línea)
-        2. No hay un ganador y el tablero está lleno (empate)
-        
-        Args:
-            estado: Estado del tablero a evaluar
-            
-        Returns:
-            bool: True si el juego terminó, False si continúa
-        """
-        # Verificar si hay ganador
-        if self._hay_ganador(estado) is not None:
-            return True
-        
-        # Verificar si el tablero está lleno
-        return all(casilla != CASILLA_VACIA 
-                  for fila in estado 
-                  for casilla in fila)
-
-    def utilidad(self, estado: List[List[str]], jugador: str = JUGADOR_MAX) -> float:
-        """
-        Calcula la utilidad de un estado terminal desde la perspectiva del jugador especificado.
-        
-        Args:
-            estado: Estado terminal del juego
-            jugador: Jugador desde cuya perspectiva calcular la utilidad (por defecto JUGADOR_MAX)
-            
-        Returns:
-            float: 1.0 si el jugador gana, 0.0 si el jugador pierde, 0.5 si empate
-            
-        Raises:
-            ValueError: Si el estado no es terminal
-        """
-        if not self.test_terminal(estado):
-            raise ValueError("No se puede calcular utilidad en estado no terminal")
-        
-        ganador = self._hay_ganador(estado)
-        
-        if ganador == jugador:
-            return 1.0
-        elif ganador is not None and ganador != jugador:
-            return 0.0
-        else:
-            return 0.5  # Empate
-
-    def _hay_ganador(self, estado: List[List[str]]) -> Optional[str]:
-        """
-        Función auxiliar para verificar si hay un ganador.
-        
-        Args:
-            estado: Estado del tablero
-            
-        Returns:
-            Optional[str]: El jugador ganador ("X" o "O") o None si no hay ganador
-        """
-        # Verificar filas
-        for fila in estado:
-            if fila[0] == fila[1] == fila[2] != CASILLA_VACIA:
-                return fila[0]
-        
-        # Verificar columnas
-        for col in range(3):
-            if estado[0][col] == estado[1][col] == estado[2][col] != CASILLA_VACIA:
-                return estado[0][col]
-        
-        # Verificar diagonales
-        if estado[0][0] == estado[1][1] == estado[2][2] != CASILLA_VACIA:
-            return estado[0][0]
-        
-        if estado[0][2] == estado[1][1] == estado[2][0] != CASILLA_VACIA:
-            return estado[0][2]
-        
-        return None
-
-    def mostrar_tablero(self, estado: List[List[str]]) -> str:
-        """
-        Función auxiliar para mostrar el tablero de forma legible.
-        
-        Args:
-            estado: Estado del tablero
-            
-        Returns:
-            str: Representación visual del tablero
-        """
-        resultado = "\n  0   1   2\n"
-        for i, fila in enumerate(estado):
-            resultado += f"{i} "
-            for j, casilla in enumerate(fila):
-                resultado += f" {casilla} "
-                if j < 2:
-                    resultado += "|"
-            resultado += "\n"
-            if i < 2:
-                resultado += "  -----------\n"
-        return resultado
-
+    Las funciones del juego viven a nivel de módulo; la clase las expone
+    como métodos estáticos para que se puedan usar desde una instancia, y
+    el estado inicial como atributo de clase.
+    """
+    
+    estado_inicial = ESTADO_INICIAL
 
+    jugador = staticmethod(jugador)
+    acciones = staticmethod(acciones)
+    num_acciones = staticmethod(num_acciones)
+    resultado = staticmethod(resultado)
+    evaluar = staticmethod(evaluar)
+    test_terminal = staticmethod(test_terminal)
+    utilidad = staticmethod(utilidad)
+    _hay_ganador = staticmethod(_hay_ganador)
+    mostrar_tablero = staticmethod(mostrar_tablero)
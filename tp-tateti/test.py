@@ -7,37 +7,73 @@ de los alumnos funcionen correctamente.
 Ejecutar con: python test.py
 """
 
+import sys
 import unittest
-import copy
 from tateti import (
-    Tateti, JUGADOR_MAX, JUGADOR_MIN, CASILLA_VACIA
+    Tateti, JUGADOR_MAX, JUGADOR_MIN, CASILLA_VACIA, HAY_LINEA, LINEAS_GANADORAS,
+    accion_original, canonico, casilla, codificar, decodificar, desde_tablero
 )
-from estrategias import estrategia_aleatoria, estrategia_minimax
+from estrategias import JUGADAS, estrategia_aleatoria, estrategia_minimax
+from generar_tabla import generar_jugadas
 
-class TestTatetiGame(unittest.TestCase):
-    """Pruebas para el módulo tateti"""
+class PruebaConTateti(unittest.TestCase):
+    """Base de las pruebas que usan una instancia de Tateti"""
     
-    def setUp(self):
-        """Configuración inicial para cada test"""
-        self.tateti = Tateti()
+    @classmethod
+    def setUpClass(cls):
+        """Configuración inicial, compartida por los tests de la clase"""
+        # Tateti no guarda estado propio, así que basta una instancia
+        cls.tateti = Tateti()
+
+class TestTatetiGame(PruebaConTateti):
+    """Pruebas para el módulo tateti"""
     
     def test_estado_inicial(self):
         """Prueba que el estado inicial sea correcto"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
-        self.assertEqual(len(estado), 3)
-        self.assertEqual(len(estado[0]), 3)
-        self.assertTrue(all(casilla == CASILLA_VACIA 
-                           for fila in estado 
-                           for casilla in fila))
+        estado = self.tateti.estado_inicial
+        self.assertTrue(all(casilla(estado, i, j) == CASILLA_VACIA 
+                           for i in range(3) 
+                           for j in range(3)))
+    
+    def test_desde_tablero(self):
+        """Prueba que la conversión desde un tablero conserve cada casilla"""
+        tablero = [
+            [JUGADOR_MAX, JUGADOR_MIN, CASILLA_VACIA],
+            [CASILLA_VACIA, JUGADOR_MAX, CASILLA_VACIA],
+            [JUGADOR_MIN, CASILLA_VACIA, CASILLA_VACIA]
+        ]
+        estado = desde_tablero(tablero)
+        for i in range(3):
+            for j in range(3):
+                self.assertEqual(casilla(estado, i, j), tablero[i][j])
+        self.assertEqual(decodificar(codificar(estado)), estado)
+    
+    def test_canonico_simetrias(self):
+        """Prueba que los estados simétricos compartan la forma canónica"""
+        # X en cada esquina del tablero: las 4 son equivalentes
+        esquinas = [self.tateti.resultado(self.tateti.estado_inicial, accion)
+                    for accion in [(0, 0), (0, 2), (2, 0), (2, 2)]]
+        canonicos = {canonico(estado)[0] for estado in esquinas}
+        self.assertEqual(len(canonicos), 1)
+        
+        # Cada acción sobre el canónico equivale a su original sobre el estado
+        for estado in esquinas:
+            forma, simetria = canonico(estado)
+            for accion in self.tateti.acciones(forma):
+                original = accion_original(accion, simetria)
+                self.assertEqual(
+                    canonico(self.tateti.resultado(estado, original))[0],
+                    canonico(self.tateti.resultado(forma, accion))[0]
+                )
     
     def test_jugador_estado_inicial(self):
         """Prueba que MAX empiece primero"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
+        estado = self.tateti.estado_inicial
         self.assertEqual(self.tateti.jugador(estado), JUGADOR_MAX)
     
     def test_jugador_alternancia(self):
         """Prueba que los jugadores alternen correctamente"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
+        estado = self.tateti.estado_inicial
         # Después de una jugada de MAX, debe ser turno de MIN
         estado_tras_max = self.tateti.resultado(estado, (0, 0))
         self.assertEqual(self.tateti.jugador(estado_tras_max), JUGADOR_MIN)
@@ -48,34 +84,36 @@ class TestTatetiGame(unittest.TestCase):
     
     def test_acciones_estado_inicial(self):
         """Prueba que las acciones iniciales sean todas las casillas"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
+        estado = self.tateti.estado_inicial
         acciones_esperadas = [(i, j) for i in range(3) for j in range(3)]
         self.assertEqual(set(self.tateti.acciones(estado)), set(acciones_esperadas))
     
     def test_acciones_estado_parcial(self):
         """Prueba acciones en un estado parcialmente lleno"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
-        estado[0][0] = JUGADOR_MAX
-        estado[1][1] = JUGADOR_MIN
+        estado = desde_tablero([
+            [JUGADOR_MAX, CASILLA_VACIA, CASILLA_VACIA],
+            [CASILLA_VACIA, JUGADOR_MIN, CASILLA_VACIA],
+            [CASILLA_VACIA, CASILLA_VACIA, CASILLA_VACIA]
+        ])
         
         acciones_disponibles = self.tateti.acciones(estado)
         self.assertNotIn((0, 0), acciones_disponibles)
         self.assertNotIn((1, 1), acciones_disponibles)
         self.assertEqual(len(acciones_disponibles), 7)
+        self.assertEqual(self.tateti.num_acciones(estado), 7)
     
     def test_resultado_jugada_valida(self):
         """Prueba que resultado funcione con jugadas válidas"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
+        estado = self.tateti.estado_inicial
         nuevo_estado = self.tateti.resultado(estado, (1, 1))
         
-        self.assertEqual(nuevo_estado[1][1], JUGADOR_MAX)
+        self.assertEqual(casilla(nuevo_estado, 1, 1), JUGADOR_MAX)
         # El estado original no debe cambiar
-        self.assertEqual(estado[1][1], CASILLA_VACIA)
+        self.assertEqual(casilla(estado, 1, 1), CASILLA_VACIA)
     
     def test_resultado_jugada_invalida(self):
         """Prueba que resultado lance error con jugadas inválidas"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
-        estado[1][1] = JUGADOR_MAX
+        estado = self.tateti.resultado(self.tateti.estado_inicial, (1, 1))
         
         with self.assertRaises(ValueError):
             self.tateti.resultado(estado, (1, 1))  # Casilla ocupada
@@ -85,86 +123,100 @@ class TestTatetiGame(unittest.TestCase):
     
     def test_terminal_estado_inicial(self):
         """Prueba que el estado inicial no sea terminal"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
+        estado = self.tateti.estado_inicial
         self.assertFalse(self.tateti.test_terminal(estado))
     
     def test_terminal_victoria_fila(self):
         """Prueba detección de victoria en fila"""
-        estado = [
+        estado = desde_tablero([
             [JUGADOR_MAX, JUGADOR_MAX, JUGADOR_MAX],
             [JUGADOR_MIN, JUGADOR_MIN, CASILLA_VACIA],
             [CASILLA_VACIA, CASILLA_VACIA, CASILLA_VACIA]
-        ]
+        ])
         self.assertTrue(self.tateti.test_terminal(estado))
         self.assertEqual(self.tateti.utilidad(estado), 1.0)
     
     def test_terminal_victoria_columna(self):
         """Prueba detección de victoria en columna"""
-        estado = [
+        estado = desde_tablero([
             [JUGADOR_MIN, JUGADOR_MAX, CASILLA_VACIA],
             [JUGADOR_MIN, JUGADOR_MAX, CASILLA_VACIA],
             [JUGADOR_MIN, CASILLA_VACIA, CASILLA_VACIA]
-        ]
+        ])
         self.assertTrue(self.tateti.test_terminal(estado))
         self.assertEqual(self.tateti.utilidad(estado), 0.0)
     
     def test_terminal_victoria_diagonal(self):
         """Prueba detección de victoria en diagonal"""
-        estado = [
+        estado = desde_tablero([
             [JUGADOR_MAX, JUGADOR_MIN, CASILLA_VACIA],
             [JUGADOR_MIN, JUGADOR_MAX, CASILLA_VACIA],
             [CASILLA_VACIA, CASILLA_VACIA, JUGADOR_MAX]
-        ]
+        ])
         self.assertTrue(self.tateti.test_terminal(estado))
         self.assertEqual(self.tateti.utilidad(estado), 1.0)
     
     def test_terminal_empate(self):
         """Prueba detección de empate"""
-        estado = [
+        estado = desde_tablero([
             [JUGADOR_MAX, JUGADOR_MIN, JUGADOR_MAX],
             [JUGADOR_MIN, JUGADOR_MIN, JUGADOR_MAX],
             [JUGADOR_MIN, JUGADOR_MAX, JUGADOR_MIN]
-        ]
+        ])
         self.assertTrue(self.tateti.test_terminal(estado))
         self.assertEqual(self.tateti.utilidad(estado), 0.5)
         # El empate debe ser 0.5 para ambos jugadores
         self.assertEqual(self.tateti.utilidad(estado, JUGADOR_MAX), 0.5)
         self.assertEqual(self.tateti.utilidad(estado, JUGADOR_MIN), 0.5)
     
+    def test_evaluar(self):
+        """Prueba que evaluar coincida con test_terminal y utilidad"""
+        estado = self.tateti.estado_inicial
+        self.assertEqual(self.tateti.evaluar(estado), (False, None))
+        
+        estado = desde_tablero([
+            [JUGADOR_MIN, JUGADOR_MAX, CASILLA_VACIA],
+            [JUGADOR_MIN, JUGADOR_MAX, CASILLA_VACIA],
+            [JUGADOR_MIN, CASILLA_VACIA, CASILLA_VACIA]
+        ])
+        self.assertEqual(self.tateti.evaluar(estado), (True, 0.0))
+    
+    def test_hay_linea(self):
+        """Prueba la tabla de líneas completas contra las líneas ganadoras"""
+        for mascara in range(512):
+            completa = any(mascara & linea == linea for linea in LINEAS_GANADORAS)
+            self.assertEqual(bool(HAY_LINEA[mascara]), completa)
+    
     def test_utilidad_desde_perspectiva_min(self):
         """Prueba que la utilidad se calcule correctamente desde la perspectiva de MIN"""
         # Estado donde MAX gana
-        estado_max_gana = [
+        estado_max_gana = desde_tablero([
             [JUGADOR_MAX, JUGADOR_MAX, JUGADOR_MAX],
             [JUGADOR_MIN, JUGADOR_MIN, CASILLA_VACIA],
             [CASILLA_VACIA, CASILLA_VACIA, CASILLA_VACIA]
-        ]
+        ])
         # Desde perspectiva de MAX: victoria = 1.0
         self.assertEqual(self.tateti.utilidad(estado_max_gana, JUGADOR_MAX), 1.0)
         # Desde perspectiva de MIN: derrota = 0.0
         self.assertEqual(self.tateti.utilidad(estado_max_gana, JUGADOR_MIN), 0.0)
         
         # Estado donde MIN gana
-        estado_min_gana = [
+        estado_min_gana = desde_tablero([
             [JUGADOR_MIN, JUGADOR_MIN, JUGADOR_MIN],
             [JUGADOR_MAX, JUGADOR_MAX, CASILLA_VACIA],
             [CASILLA_VACIA, CASILLA_VACIA, CASILLA_VACIA]
-        ]
+        ])
         # Desde perspectiva de MAX: derrota = 0.0
         self.assertEqual(self.tateti.utilidad(estado_min_gana, JUGADOR_MAX), 0.0)
         # Desde perspectiva de MIN: victoria = 1.0
         self.assertEqual(self.tateti.utilidad(estado_min_gana, JUGADOR_MIN), 1.0)
 
-class TestEstrategias(unittest.TestCase):
+class TestEstrategias(PruebaConTateti):
     """Pruebas para el módulo estrategias"""
     
-    def setUp(self):
-        """Configuración inicial para cada test"""
-        self.tateti = Tateti()
-    
     def test_estrategia_aleatoria_estado_inicial(self):
         """Prueba que la estrategia aleatoria funcione"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
+        estado = self.tateti.estado_inicial
         accion = estrategia_aleatoria(self.tateti, estado)
         
         self.assertIsInstance(accion, tuple)
@@ -173,18 +225,18 @@ class TestEstrategias(unittest.TestCase):
     
     def test_estrategia_aleatoria_sin_acciones(self):
         """Prueba que la estrategia aleatoria falle sin acciones"""
-        estado = [
+        estado = desde_tablero([
             [JUGADOR_MAX, JUGADOR_MIN, JUGADOR_MAX],
             [JUGADOR_MIN, JUGADOR_MIN, JUGADOR_MAX],
             [JUGADOR_MIN, JUGADOR_MAX, JUGADOR_MIN]
-        ]
+        ])
         
         with self.assertRaises(ValueError):
             estrategia_aleatoria(self.tateti, estado)
     
     def test_minimax_devuelve_accion_valida(self):
         """Prueba básica de que minimax devuelva una acción válida"""
-        estado = copy.deepcopy(self.tateti.estado_inicial)
+        estado = self.tateti.estado_inicial
         try:
             accion = estrategia_minimax(self.tateti, estado)
             self.assertIsInstance(accion, tuple)
@@ -194,21 +246,23 @@ class TestEstrategias(unittest.TestCase):
             # Es aceptable si no está implementado aún
             pass
 
-class TestEscenariosMinimax(unittest.TestCase):
+class TestEscenariosMinimax(PruebaConTateti):
     """Pruebas específicas para verificar la lógica del minimax"""
     
-    def setUp(self):
-        """Configuración inicial para cada test"""
-        self.tateti = Tateti()
+    def test_tabla_jugadas_al_dia(self):
+        """Prueba que minimax.json tenga la jugada de cada estado canónico no terminal"""
+        esperadas = {clave: tuple(accion)
+                     for clave, accion in generar_jugadas(self.tateti).items()}
+        self.assertEqual(JUGADAS, esperadas)
     
     def test_minimax_victoria_inmediata(self):
         """Prueba que minimax tome una victoria inmediata"""
         # Estado donde MAX puede ganar en un movimiento
-        estado = [
+        estado = desde_tablero([
             [JUGADOR_MAX, JUGADOR_MAX, CASILLA_VACIA],  # MAX puede ganar en (0,2)
             [JUGADOR_MIN, JUGADOR_MIN, CASILLA_VACIA],
             [CASILLA_VACIA, CASILLA_VACIA, CASILLA_VACIA]
-        ]
+        ])
         
         try:
             accion = estrategia_minimax(self.tateti, estado)
@@ -223,11 +277,11 @@ class TestEscenariosMinimax(unittest.TestCase):
     def test_minimax_bloquear_victoria_oponente(self):
         """Prueba que minimax bloquee una victoria del oponente"""
         # Estado donde MIN puede ganar si MAX no bloquea
-        estado = [
+        estado = desde_tablero([
             [JUGADOR_MIN, JUGADOR_MIN, CASILLA_VACIA],  # MIN puede ganar en (0,2)
             [JUGADOR_MAX, CASILLA_VACIA, CASILLA_VACIA],
             [CASILLA_VACIA, CASILLA_VACIA, CASILLA_VACIA]
-        ]
+        ])
         
         try:
             accion = estrategia_minimax(self.tateti, estado)
@@ -243,7 +297,7 @@ def ejecutar_pruebas():
     """Ejecuta todas las pruebas y muestra un resumen"""
     print("=== EJECUTANDO PRUEBAS DEL PROYECTO TATETI ===\n")
     
-    suite = unittest.TestLoader().loadTestsFromModule(__import__(__name__))
+    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
     runner = unittest.TextTestRunner(verbosity=2)
     resultado = runner.run(suite)
     
@@ -0,0 +1,119 @@
+"""Este modulo define las versiones compiladas con Numba de los ciclos del TSP.
+
+Requiere de los paquetes numpy y numba. Si no estan instalados, problem.py
+usa las versiones vectorizadas con NumPy.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def obj_val_core(dist: np.ndarray, state: np.ndarray) -> float:
+    """Calcula el valor objetivo de un estado.
+
+    Argumentos:
+    ==========
+    dist: np.ndarray
+        matriz de distancias indexada por ciudad (float64[n, n])
+    state: np.ndarray
+        un estado (int32[n])
+
+    Retorno:
+    =======
+    value: float
+        valor objetivo
+    """
+    n = state.shape[0]
+    value = -dist[state[n - 1], state[0]]  # arista que cierra el ciclo
+    for i in range(n - 1):
+        value -= dist[state[i], state[i + 1]]
+    return value
+
+
+@njit(cache=True)
+def max_action_core(dist: np.ndarray, state: np.ndarray) -> tuple[int, int, float]:
+    """Busca la accion 2-opt que genera el sucesor con mayor valor objetivo.
+
+    Recorre las acciones en el mismo orden que TSP.actions() y se queda con
+    la primera de mayor valor, igual que la version con NumPy.
+
+    Argumentos:
+    ==========
+    dist: np.ndarray
+        matriz de distancias indexada por ciudad (float64[n, n])
+    state: np.ndarray
+        un estado (int32[n])
+
+    Retorno:
+    =======
+    i, j: int
+        accion elegida, (-1, -1) si no hay acciones
+    max_val: float
+        valor objetivo del sucesor que resulta de aplicar la accion
+    """
+    n = state.shape[0]
+    value = obj_val_core(dist, state)
+    max_i, max_j = -1, -1
+    max_val = -np.inf
+    for i in range(n - 2):
+        v1 = state[i]  # origen de i
+        v2 = state[i + 1]  # destino de i
+        distl1l2 = dist[v1, v2]
+        # (0,n-1) elige dos aristas adyacentes: con i = 0, j llega hasta n-2
+        for j in range(i + 2, n if i > 0 else n - 1):
+            v3 = state[j]  # origen de j
+            v4 = state[(j + 1) % n]  # destino de j
+            succ_value = value + distl1l2 + dist[v3, v4] - dist[v1, v3] - dist[v2, v4]
+            if succ_value > max_val:
+                max_i, max_j = i, j
+                max_val = succ_value
+    return max_i, max_j, max_val
+
+
+@njit(cache=True)
+def first_improvement_core(dist: np.ndarray, state: np.ndarray, rows: np.ndarray,
+                           cols: np.ndarray, start: int) -> tuple[int, int, float]:
+    """Busca la primera accion 2-opt que mejora el valor objetivo.
+
+    Recorre las acciones (rows[k], cols[k]) desde k = start, dando la vuelta
+    al final, y se detiene en la primera que mejora el estado. Si ninguna lo
+    mejora, devuelve la de mayor valor.
+
+    Argumentos:
+    ==========
+    dist: np.ndarray
+        matriz de distancias indexada por ciudad (float64[n, n])
+    state: np.ndarray
+        un estado (int32[n])
+    rows, cols: np.ndarray
+        componentes i y j de cada accion (int32[m])
+    start: int
+        indice de la primera accion a evaluar
+
+    Retorno:
+    =======
+    i, j: int
+        accion elegida, (-1, -1) si no hay acciones
+    max_val: float
+        valor objetivo del sucesor que resulta de aplicar la accion
+    """
+    n = state.shape[0]
+    m = rows.shape[0]
+    value = obj_val_core(dist, state)
+    max_i, max_j = -1, -1
+    max_val = -np.inf
+    for t in range(m):
+        k = (start + t) % m
+        i, j = rows[k], cols[k]
+        v1 = state[i]  # origen de i
+        v2 = state[i + 1]  # destino de i
+        v3 = state[j]  # origen de j
+        v4 = state[(j + 1) % n]  # destino de j
+        succ_value = value + dist[v1, v2] + dist[v3, v4] - dist[v1, v3] - dist[v2, v4]
+        if succ_value > value:
+            return i, j, succ_value
+        if succ_value > max_val:
+            max_i, max_j = i, j
+            max_val = succ_value
+    return max_i, max_j, max_val
@@ -40,9 +40,9 @@ def show(G: nx.Graph,
         nx.draw_networkx_nodes(G, pos=coords, node_size=10,
                                ax=axs[i], node_color="black")
 
-        # Dibujar las aristas del tour
+        # Dibujar las aristas del tour, incluida la que vuelve al inicio
         tour = [i+1 for i in tour]
-        edges = list(zip(tour, tour[1:]))
+        edges = list(zip(tour, tour[1:] + tour[:1]))
         nx.draw_networkx_edges(G, pos=coords, edgelist=edges,
                                ax=axs[i], label="{}: {}".format(algo, val),
                                edge_color=next(colors)["color"])
@@ -7,12 +7,13 @@ Formulacion de estado completo para el Problema del Viajante:
 
 * Estados:
     Consideramos n ciudades enumeradas del 0 al n-1.
-    Cada estado es de la forma [0] ++ permutacion(1,n-1) ++ [0].
+    Cada estado es de la forma [0] ++ permutacion(1,n-1), un ciclo que
+    vuelve de la ultima ciudad a la 0 sin repetirla al final.
     Total de estados: (n-1)! pues la primera ciudad del tour ya esta fija.
-    Ejemplo con n = 4: [0,1,2,3,0], [0,1,3,2,0], etc.
+    Ejemplo con n = 4: [0,1,2,3], [0,1,3,2], etc.
 
 * Estado inicial.
-    Consideramos el estado inicial [0,1,2,...,n-1,0].
+    Consideramos el estado inicial [0,1,2,...,n-1].
     Pero cualquier estado puede ser inicial.
 
 * Acciones.
@@ -21,25 +22,44 @@ Formulacion de estado completo para el Problema del Viajante:
     https://en.wikipedia.org/wiki/2-opt
     Cada accion se puede representar de la siguiente forma.
     (i,j): intercambiar la i-esima arista con la j-esima arista,
+    donde la arista k va de v_k a v_k+1 (y la n-1 de v_n-1 a v_0),
     con 0 <= i <= n-3, i+2 <= j <= n-1.
     Notar que las aristas elegidas no deben ser adyacentes.
 
 * Resultado.
-    resultado([v_0,...,v_n], (i,j)) =
-        [v_0,...,v_i] ++ [v_j,...,v_i+1] ++ [v_j+1,...,v_n]
+    resultado([v_0,...,v_n-1], (i,j)) =
+        [v_0,...,v_i] ++ [v_j,...,v_i+1] ++ [v_j+1,...,v_n-1]
     Notar que [v_j,...,v_i+1] es el reverso de [v_i+1,...,v_j]
 
 * Funcion objetivo:
-    obj_val([v_0,v_1,...,v_n-1,v_n]) =
-        - dist[v_0][v_1] - ... - dist[v_n-1][v_n]
+    obj_val([v_0,v_1,...,v_n-1]) =
+        - dist[v_0][v_1] - ... - dist[v_n-2][v_n-1] - dist[v_n-1][v_0]
     El objetivo es minimizar la distancia, es decir,
     maximizar el opuesto de las distancias.
 """
 
 from __future__ import annotations
-from typing import TypeVar
-from random import shuffle
-from networkx import Graph
+from copy import copy
+from typing import Any, Callable, Optional, TypeVar
+from multiprocessing import Pool
+import random
+from random import randrange, shuffle
+from networkx import Graph, convert_node_labels_to_integers
+import numpy as np
+
+# Versiones compiladas con Numba, None si no esta instalado
+first_improvement_core: Optional[Callable[..., Any]]
+max_action_core: Optional[Callable[..., Any]]
+obj_val_core: Optional[Callable[..., Any]]
+
+try:
+    from _tsp_numba import first_improvement_core, max_action_core, obj_val_core
+except ImportError:
+    # Numba es opcional, sin el se usan las versiones con NumPy
+    first_improvement_core = max_action_core = obj_val_core = None
+
+# Cantidad maxima de valores objetivo guardados por instancia de TSP
+OBJ_VAL_CACHE_SIZE = 1 << 16
 
 State = TypeVar('State')
 Action = TypeVar('Action')
@@ -50,7 +70,7 @@ class OptProblem:
 
     def __init__(self) -> None:
         """Construye una instancia de la clase."""
-        self.init = None
+        self.init: Any = None
 
     def actions(self, state: State) -> list[Action]:
         """Determina la lista de acciones que se pueden aplicar a un estado."""
@@ -64,6 +84,14 @@ class OptProblem:
         """Determina el valor objetivo de un estado."""
         raise NotImplementedError
 
+    def obj_val_incremental(self, value: float, state: State, action: Action) -> float:
+        """Determina el valor objetivo del sucesor a partir del valor del estado.
+
+        Evita recalcular self.obj_val() sobre el sucesor cuando ya se conoce el
+        valor del estado actual.
+        """
+        raise NotImplementedError
+
     def max_action(self, state: State) -> tuple[Action, float]:
         """Determina la accion que genera el sucesor con mayor valor objetivo para un estado dado.
 
@@ -83,7 +111,7 @@ class OptProblem:
 class TSP(OptProblem):
     """Subclase que representa al Problema del Viajante (TSP).
 
-    Un estado es una lista de enteros: list[int].
+    Un estado es un arreglo de enteros: np.ndarray (int32[n]).
     Una accion es un par de enteros: tuple[int,int].
     """
 
@@ -98,55 +126,99 @@ class TSP(OptProblem):
         """
         super().__init__()
         self.G = G
-        self.init = list(range(0, G.number_of_nodes()))
-        self.init.append(0)
 
-    def actions(self, state: list[int]) -> list[tuple[int, int]]:
+        # Matriz de distancias indexada por ciudad, para no consultar los
+        # atributos de las aristas en cada evaluacion. Los nodos se
+        # renumeran de 0 a n-1, en orden, como las ciudades de los estados
+        n = G.number_of_nodes()
+        G0 = convert_node_labels_to_integers(G, first_label=0, ordering='sorted')
+        self.dist = np.zeros((n, n), dtype=np.float64)
+        for u, v, w in G0.edges(data='weight'):
+            self.dist[u, v] = self.dist[v, u] = w
+
+        # Las acciones solo dependen de n, asi que se calculan una vez:
+        # (i,j) con i+2 <= j, salvo (0,n-1), que elige dos aristas adyacentes
+        # (con i = 0, j llega solo hasta n-2)
+        self._actions = tuple((i, j)
+                              for i in range(0, n - 2)
+                              for j in range(i + 2, n if i > 0 else n - 1))
+
+        # Mascara de las acciones validas, para max_action
+        self._valid_actions = np.zeros((n, n), dtype=bool)
+        for i, j in self._actions:
+            self._valid_actions[i, j] = True
+
+        # Componentes i y j de cada accion, en el orden de self._actions
+        self._action_rows = np.array([i for i, _ in self._actions], dtype=np.int32)
+        self._action_cols = np.array([j for _, j in self._actions], dtype=np.int32)
+
+        # Valores objetivo ya calculados, indexados por los bytes del estado,
+        # y el ultimo sucesor elegido por max_action (estado, accion y
+        # valor), que se guarda cuando result() lo construye
+        self._values: dict[bytes, float] = {}
+        self._pending: Optional[tuple[bytes, tuple[int, int], float]] = None
+
+        self.init = np.arange(n, dtype=np.int32)
+
+        # Compilar las versiones con Numba antes de empezar a medir tiempos
+        if max_action_core is not None and first_improvement_core is not None:
+            max_action_core(self.dist, self.init)
+            first_improvement_core(self.dist, self.init, self._action_rows,
+                                   self._action_cols, 0)
+
+    def actions(self, state: np.ndarray) -> tuple[tuple[int, int], ...]:
         """Determina la lista de acciones que se pueden aplicar a un estado.
 
+        Son las mismas para todos los estados, precalculadas en __init__.
+        Se devuelven como tupla porque todas las llamadas comparten el mismo
+        objeto: para modificarlas, copiarlas antes con list().
+
         Argumentos:
         ==========
-        state: list[int]
+        state: np.ndarray
             un estado
 
         Retorno:
         =======
-        act: list[tuple[int, int]]
-            lista de acciones
+        act: tuple[tuple[int, int], ...]
+            acciones
         """
-        act = []
-        for i in range(0, self.G.number_of_nodes() - 2):
-            for j in range(i + 2, self.G.number_of_nodes()):
-                if (j + 1) % self.G.number_of_nodes() != i:
-                    act.append((i, j))
-        return act
-
-    def result(self, state: list[int], action: tuple[int, int]) -> list[int]:
+        return self._actions
+
+    def result(self, state: np.ndarray, action: tuple[int, int]) -> np.ndarray:
         """Determina el estado que resulta de aplicar una accion a un estado.
 
         Argumentos:
         ==========
-        state: list[int]
+        state: np.ndarray
             un estado
         action: tuple[int, int]
             una accion de self.acciones(state)
 
         Retorno:
         =======
-        succ: list[int]
+        succ: np.ndarray
             estado sucesor
         """
-        succ = list(state)  # copy of the current state
+        # Mismo tipo que usan obj_val y max_action para las claves de la cache
+        state = np.asarray(state, dtype=np.int32)
+        succ = state.copy()  # copy of the current state
         i, j = action
-        succ[i + 1: j+1] = state[i + 1: j+1][::-1]  # reverse
+        succ[i + 1: j+1] = succ[i + 1: j+1][::-1]  # reverse
+
+        # Si es el sucesor que eligio max_action, ya se conoce su valor
+        if self._pending is not None:
+            key, max_act, max_val = self._pending
+            if max_act == action and key == state.tobytes():
+                self._store(succ.tobytes(), max_val)
         return succ
 
-    def obj_val(self, state: list[int]) -> float:
+    def obj_val(self, state: np.ndarray) -> float:
         """Determina el valor objetivo de un estado.
 
         Argumentos:
         ==========
-        state: list[int]
+        state: np.ndarray
             un estado
 
         Retorno:
@@ -154,60 +226,245 @@ class TSP(OptProblem):
         value: float
             valor objetivo
         """
-        value = 0
-        for i in range(0, self.G.number_of_nodes()):
-            u = state[i]+1  # origen
-            v = state[i+1]+1  # destino
-            value -= self.G.get_edge_data(u, v)['weight']
+        tour = np.asarray(state, dtype=np.int32)
+        key = tour.tobytes()
+        value = self._values.get(key)
+        if value is None:
+            if obj_val_core is not None:
+                value = obj_val_core(self.dist, tour)
+            else:
+                value = -float(self.dist[tour, np.roll(tour, -1)].sum())
+            self._store(key, value)
         return value
 
-    def max_action(self, state: list[int]) -> tuple[tuple[int, int], float]:
+    def obj_val_incremental(self, value: float, state: np.ndarray,
+                            action: tuple[int, int]) -> float:
+        """Determina el valor objetivo del sucesor a partir del valor del estado.
+
+        Solo cambian las dos aristas que se intercambian, asi que alcanza con
+        sumar y restar sus distancias en lugar de recorrer todo el tour.
+
+        Argumentos:
+        ==========
+        value: float
+            valor objetivo de state
+        state: np.ndarray
+            un estado
+        action: tuple[int, int]
+            una accion de self.acciones(state)
+
+        Retorno:
+        =======
+        succ_value: float
+            valor objetivo de self.result(state, action)
+        """
+        i, j = action
+        v1 = state[i]  # origen de i
+        v2 = state[i + 1]  # destino de i
+        v3 = state[j]  # origen de j
+        v4 = state[(j + 1) % len(state)]  # destino de j
+        d = self.dist
+        return float(value + d[v1, v2] + d[v3, v4] - d[v1, v3] - d[v2, v4])
+
+    def _store(self, key: bytes, value: float) -> None:
+        """Guarda el valor objetivo de un estado, vaciando la cache si se lleno.
+
+        Argumentos:
+        ==========
+        key: bytes
+            bytes del estado
+        value: float
+            valor objetivo
+        """
+        if len(self._values) >= OBJ_VAL_CACHE_SIZE:
+            self._values.clear()
+        self._values[key] = value
+
+    def max_action(self, state: np.ndarray,
+                   first_improvement: bool = False
+                   ) -> tuple[Optional[tuple[int, int]], float]:
         """Determina la accion que genera el sucesor con mayor valor objetivo para un estado dado.
         
         Se encuentra optimizada y por razones de eficiencia no se generan los sucesores y 
         tampoco se llama a self.obj_val().
 
+        El valor devuelto es exacto: quien lo use no necesita volver a llamar a
+        self.obj_val() sobre el sucesor.
+
+        Con first_improvement, devuelve en cambio la primera accion que mejora
+        el estado, recorriendo las acciones desde una al azar para no
+        favorecer a las primeras. Si ninguna lo mejora, devuelve la mejor.
+
         Argumentos:
         ==========
-        state: list[int]
+        state: np.ndarray
             un estado
+        first_improvement: bool
+            si es True, detenerse en la primera accion que mejora el estado
 
         Retorno:
         =======
-        max_act: tuple[int, int]
-            accion que genera el sucesor con mayor valor objetivo
+        max_act: tuple[int, int] | None
+            accion que genera el sucesor con mayor valor objetivo,
+            None si el estado no tiene acciones
         max_val: float
-            valor objetivo del sucesor que resulta de aplicar min_act
+            valor objetivo del sucesor que resulta de aplicar min_act,
+            -inf si el estado no tiene acciones
         """
-        value = self.obj_val(state)
-        max_act = None
-        max_val = float("-inf")
-        for a in self.actions(state):
-            i, j = a
-            v1 = state[i]+1  # origen de i
-            v2 = state[i+1]+1  # destino de i
-            v3 = state[j]+1  # origen de j
-            v4 = state[j+1]+1  # destino de j
-            distl1l2 = self.G.get_edge_data(v1, v2)['weight']
-            distl3l4 = self.G.get_edge_data(v3, v4)['weight']
-            distl1l3 = self.G.get_edge_data(v1, v3)['weight']
-            distl2l4 = self.G.get_edge_data(v2, v4)['weight']
-            succ_value =  value + distl1l2 + distl3l4 - distl1l3 - distl2l4
-            if succ_value > max_val:
-                max_act = a
-                max_val = succ_value
+        tour = np.asarray(state, dtype=np.int32)
+        if first_improvement:
+            max_act, max_val = self._first_improvement(tour)
+        else:
+            max_act, max_val = self._max_action(tour)
+        if max_act is not None:
+            self._pending = (tour.tobytes(), max_act, max_val)
         return max_act, max_val
 
-    def random_reset(self) -> list[int]:
+    def _max_action(self, tour: np.ndarray) -> tuple[Optional[tuple[int, int]], float]:
+        """Calcula max_action, con Numba si esta disponible o con NumPy.
+
+        Devuelve (None, -inf) si no hay acciones.
+        """
+        if max_action_core is not None:
+            i, j, max_val = max_action_core(self.dist, tour)
+            return (None if i == -1 else (i, j)), max_val
+
+        orig = tour  # origen de cada arista
+        dest = np.roll(tour, -1)  # destino de cada arista
+        edges = self.dist[orig, dest]  # largo de cada arista
+        value = -edges.sum()
+
+        # Cambio del valor objetivo de cada accion (i,j), todas a la vez:
+        # se quitan las aristas i y j y se agregan (v_i,v_j) y (v_i+1,v_j+1)
+        delta = (edges[:, None] + edges[None, :]
+                 - self.dist[orig[:, None], orig[None, :]]
+                 - self.dist[dest[:, None], dest[None, :]])
+        delta = np.where(self._valid_actions, delta, -np.inf)
+
+        # argmax devuelve el primer maximo recorriendo por filas, que es el
+        # orden de self.actions()
+        k = int(delta.argmax())
+        if delta.flat[k] == -np.inf:
+            return None, float("-inf")
+        max_act = divmod(k, len(edges))
+        max_val = float(value + delta.flat[k])
+        return max_act, max_val
+
+    def _first_improvement(self, tour: np.ndarray
+                           ) -> tuple[Optional[tuple[int, int]], float]:
+        """Calcula max_action con first_improvement, con Numba si esta disponible o con NumPy.
+
+        Devuelve (None, -inf) si no hay acciones.
+        """
+        m = len(self._actions)
+        if m == 0:
+            return None, float("-inf")
+        start = randrange(m)
+        if first_improvement_core is not None:
+            i, j, max_val = first_improvement_core(self.dist, tour, self._action_rows,
+                                                   self._action_cols, start)
+            return (i, j), max_val
+
+        # Sin Numba no hay ahorro en cortar antes: se calcula el cambio de
+        # todas las acciones y se elige en el mismo orden que con Numba
+        rows, cols = self._action_rows, self._action_cols
+        orig = tour
+        dest = np.roll(tour, -1)
+        edges = self.dist[orig, dest]
+        value = -edges.sum()
+        delta = (edges[rows] + edges[cols]
+                 - self.dist[orig[rows], orig[cols]]
+                 - self.dist[dest[rows], dest[cols]])
+        delta = np.roll(delta, -start)
+        improving = delta > 0
+        t = int(improving.argmax()) if improving.any() else int(delta.argmax())
+        k = (start + t) % m
+        return (int(rows[k]), int(cols[k])), float(value + delta[t])
+
+    def random_reset(self) -> np.ndarray:
         """Devuelve un estado del TSP con un tour aleatorio.
         
         Retorno:
         =======
-        state: list[int]
+        state: np.ndarray
             un estado
         """
-        state = [i for i in range(1, self.G.number_of_nodes())]
-        shuffle(state)  # mezclar la lista
-        state.append(0)  # agregar a 0 como inicio del tour
-        state.insert(0, 0)  # agregar a 0 como fin del tour
+        cities = [i for i in range(1, len(self.dist))]
+        shuffle(cities)  # mezclar la lista
+        state = np.zeros(len(cities) + 1, dtype=np.int32)  # 0 como inicio del tour
+        state[1:] = cities
         return state
+
+    def random_restart_pool(self, n_restarts: int, n_workers: Optional[int] = None,
+                            seed: Optional[int] = None) -> tuple[np.ndarray, float]:
+        """Aplica ascension de colinas desde varios estados aleatorios en paralelo.
+
+        Cada reinicio es independiente, asi que se reparten entre procesos.
+        A cada uno se le asigna una semilla, de modo que con la misma seed se
+        obtiene el mismo resultado sin importar cuantos procesos se usen.
+
+        Argumentos:
+        ==========
+        n_restarts: int
+            cantidad de reinicios, al menos 1
+        n_workers: int | None
+            cantidad de procesos, por defecto uno por nucleo
+        seed: int | None
+            semilla para generar las semillas de los reinicios
+
+        Retorno:
+        =======
+        state: np.ndarray
+            mejor optimo local encontrado
+        value: float
+            valor objetivo del mejor optimo local
+
+        Excepciones:
+        ===========
+        ValueError
+            si n_restarts es menor que 1
+        """
+        if n_restarts < 1:
+            raise ValueError("n_restarts debe ser al menos 1")
+        rng = random.Random(seed)
+        seeds = [rng.getrandbits(32) for _ in range(n_restarts)]
+
+        # Los procesos solo usan la matriz de distancias y las acciones: se
+        # les envia una copia sin el grafo ni la cache de valores objetivo
+        payload = copy(self)
+        payload.G = None
+        payload._values = {}
+        payload._pending = None
+
+        with Pool(n_workers, initializer=_init_worker, initargs=(payload,)) as pool:
+            # Ante empates gana el reinicio de menor numero, para que el
+            # resultado no dependa del orden en que terminan los procesos
+            _, state, value = max(pool.imap_unordered(_restart, enumerate(seeds)),
+                                  key=lambda res: (res[2], -res[0]))
+        return state, value
+
+
+# Problema que usa cada proceso de TSP.random_restart_pool, asignado por
+# _init_worker antes de ejecutar cualquier reinicio
+_worker_problem: TSP
+
+
+def _init_worker(problem: TSP) -> None:
+    """Guarda el problema en el proceso, para no enviarlo en cada reinicio."""
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _restart(task: tuple[int, int]) -> tuple[int, np.ndarray, float]:
+    """Aplica search.HillClimbing desde el estado aleatorio de una semilla."""
+    # search importa este modulo, por eso se importa recien aca
+    from search import HillClimbing
+
+    k, seed = task
+    random.seed(seed)
+    # Cada proceso tiene su propia copia del problema, asi que se puede
+    # cambiar el estado inicial sin afectar al problema original
+    _worker_problem.init = _worker_problem.random_reset()
+    algo = HillClimbing()
+    algo.solve(_worker_problem)
+    return k, algo.tour, algo.value
@@ -17,6 +17,7 @@ No viene implementado, se debe completar.
 
 from __future__ import annotations
 from time import time
+from typing import Any
 from problem import OptProblem
 
 
@@ -27,8 +28,8 @@ class LocalSearch:
         """Construye una instancia de la clase."""
         self.niters = 0  # Numero de iteraciones totales
         self.time = 0  # Tiempo de ejecucion
-        self.tour = []  # Solucion, inicialmente vacia
-        self.value = None  # Valor objetivo de la solucion
+        self.tour: Any = []  # Solucion, inicialmente vacia
+        self.value: Any = None  # Valor objetivo de la solucion
 
     def solve(self, problem: OptProblem):
         """Resuelve un problema de optimizacion."""
@@ -0,0 +1,113 @@
+"""
+Pruebas unitarias para el proyecto TSP - Busqueda local
+
+Este archivo contiene pruebas para verificar el comportamiento de TSP.
+
+Ejecutar con: python test.py
+"""
+
+import copy
+import random
+import sys
+import unittest
+from unittest import mock
+import problem
+from load import read_tsp
+from problem import TSP
+
+class TestRandomRestartPool(unittest.TestCase):
+    """Pruebas para TSP.random_restart_pool"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Configuración inicial, compartida por los tests de la clase"""
+        G, _ = read_tsp("instances/burma14.tsp")
+        cls.problema = TSP(G)
+
+    def test_sin_reinicios(self):
+        """Prueba que se rechace una cantidad de reinicios menor que 1"""
+        for n_restarts in (0, -1):
+            with self.assertRaises(ValueError):
+                self.problema.random_restart_pool(n_restarts, n_workers=1)
+
+    def test_optimo_local(self):
+        """Prueba que el resultado sea un optimo local con su valor objetivo"""
+        state, value = self.problema.random_restart_pool(4, n_workers=2, seed=0)
+        self.assertAlmostEqual(self.problema.obj_val(state), value)
+        _, succ_val = self.problema.max_action(state)
+        self.assertLessEqual(succ_val, value)
+
+    def test_misma_semilla(self):
+        """Prueba que la misma semilla dé el mismo resultado con 1 o 2 procesos"""
+        _, value_1 = self.problema.random_restart_pool(4, n_workers=1, seed=7)
+        _, value_2 = self.problema.random_restart_pool(4, n_workers=2, seed=7)
+        self.assertEqual(value_1, value_2)
+
+    def test_no_modifica_init(self):
+        """Prueba que los reinicios no cambien el estado inicial del problema"""
+        init = self.problema.init.copy()
+        self.problema.random_restart_pool(2, n_workers=1, seed=0)
+        self.assertEqual(list(self.problema.init), list(init))
+
+    def test_copia_conserva_grafo(self):
+        """Prueba que copiar el problema conserve el grafo tras usar el pool"""
+        self.problema.random_restart_pool(2, n_workers=1, seed=0)
+        self.assertIsNotNone(self.problema.G)
+        copia = copy.deepcopy(self.problema)
+        self.assertIsNotNone(copia.G)
+        self.assertEqual(copia.G.number_of_nodes(), self.problema.G.number_of_nodes())
+
+class TestValorIncremental(unittest.TestCase):
+    """Pruebas para TSP.obj_val_incremental y TSP.max_action"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Configuración inicial, compartida por los tests de la clase"""
+        cls.G, _ = read_tsp("instances/burma14.tsp")
+
+    def verificar_tours(self, problema):
+        """Compara los cambios incrementales de cada accion con el valor completo"""
+        random.seed(0)
+        acciones = problema.actions(problema.init)
+        for _ in range(20):
+            state = problema.random_reset()
+            value = problema.obj_val(state)
+
+            deltas = []
+            for act in acciones:
+                delta = problema.obj_val_incremental(value, state, act) - value
+                self.assertAlmostEqual(problema.obj_val(problema.result(state, act)),
+                                       value + delta)
+                deltas.append(delta)
+
+            # max_action devuelve la primera accion, en el orden de
+            # actions(), con el mayor cambio
+            max_delta = max(deltas)
+            max_act, max_val = problema.max_action(state)
+            self.assertEqual(max_act, acciones[deltas.index(max_delta)])
+            self.assertAlmostEqual(max_val, value + max_delta)
+
+    def test_numpy(self):
+        """Prueba los cambios incrementales con las versiones con NumPy"""
+        with mock.patch.multiple(problem, first_improvement_core=None,
+                                 max_action_core=None, obj_val_core=None):
+            self.verificar_tours(TSP(self.G))
+
+    def test_numba(self):
+        """Prueba los cambios incrementales con las versiones con Numba"""
+        if problem.max_action_core is None:
+            self.skipTest("Numba no esta instalado")
+        self.verificar_tours(TSP(self.G))
+
+def ejecutar_pruebas():
+    """Ejecuta todas las pruebas"""
+    print("=== EJECUTANDO PRUEBAS DEL PROYECTO TSP ===\n")
+
+    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+    runner = unittest.TextTestRunner(verbosity=2)
+    resultado = runner.run(suite)
+
+    return resultado.wasSuccessful()
+
+if __name__ == "__main__":
+    ejecutar_pruebas()